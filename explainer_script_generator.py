@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 
-import requests
-import pandas as pd
-import time
-import pygsheets
 import os
+import io
+import time
+import argparse
+import hashlib
+import functools
 import logging
+import concurrent.futures
 from datetime import datetime
-from openai import OpenAI
+from pathlib import Path
+from sheets_client import get_sheet, with_backoff
 
 # Configure logging
 logging.basicConfig(
@@ -16,17 +19,74 @@ logging.basicConfig(
     handlers=[logging.FileHandler("explainer_script.log"), logging.StreamHandler()],
 )
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# On-disk cache of OpenAI responses, keyed by the sha256 of the prompt
+_cache_dir = Path(".openai_cache")
+
+# Local Parquet cache of the Daily Digest sheet, reused for up to an hour
+_digest_cache_dir = Path(".cache")
+DIGEST_CACHE_TTL = 3600
+
+# Prompt size limits: articles sent to OpenAI and characters kept per summary
+MAX_PROMPT_ARTICLES = 30
+MAX_SUMMARY_CHARS = 300
+
+# Static explainer instructions, sent as the system message. Keep anything
+# that changes per run (dates, data) out of here so the prefix stays cacheable.
+STATIC_INSTRUCTIONS = """You are a U.S.-based political journalist creating a 60-second daily briefing for an audience deeply concerned with American democracy.
+
+Use the following spreadsheet of today's U.S. news stories to identify and summarize the items with the biggest impact on democracy—this includes developments related to voting rights, elections, disinformation, political extremism, civil liberties, court decisions, legislation, government transparency, and the rule of law.
+
+Your task: Write a concise, compelling 60-second script summarizing the top U.S. democracy-impacting news of the day.
+
+Tone: Clear, urgent, and accessible. Speak directly to a civically engaged but time-crunched audience.
+
+Format:
+- Start with a bold intro (e.g., "Today in American democracy…")
+- Prioritize 3–4 stories with the clearest implications for democratic institutions or civil rights
+- Use plain, powerful language—explain why each story matters
+- End with a short wrap-up or call to attention ("We'll be tracking this," etc.)
+
+Focus on U.S. stories first, but include significant international stories that impact global democracy if they're highly relevant.
+
+""" + (
+    "Note: each story summary in the spreadsheet input is truncated to its "
+    f"first {MAX_SUMMARY_CHARS} characters."
+)
+
+# User message template; only the spreadsheet input varies between runs
+_PROMPT_TEMPLATE = """Spreadsheet input:
+{summaries_text}
+
+Write your 60-second democracy briefing (approximately 150-160 words):"""
+
+# Categories matching this pattern are ranked first when trimming the prompt
+PRIORITY_CATEGORY_PATTERN = "politic|democra|court|judicial|elect|voting|civil|rule of law"
+
+
+# Heavy dependencies (pandas, numpy, openai, pygsheets) are imported inside
+# the functions that need them, so cache-hit and skip runs start quickly.
+
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client():
+    """Create the OpenAI client on first use."""
+    import httpx
+    from openai import OpenAI
+
+    # Shared keep-alive HTTP/2 connection pool for OpenAI requests
+    http_client = httpx.Client(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
 
 
 def init_google_sheet():
     """Initialize Google Sheets client and open the Maya News Extraction spreadsheet."""
     try:
-        # Authorize with service account credentials
-        client = pygsheets.authorize(service_file="credentials.json")
-        # Open the spreadsheet by name
-        sheet = client.open("Maya News Extraction")
+        # Open the spreadsheet with the shared, cached client
+        sheet = get_sheet()
 
         logging.info("Successfully connected to Google Sheet 'Maya News Extraction'")
         return sheet
@@ -35,34 +95,85 @@ def init_google_sheet():
         return None
 
 
-def get_daily_digest_data(sheet):
-    """Get all data from today's Daily Digest sheet."""
+def fetch_sheets_bulk(sheet, ranges):
+    """Fetch several A1 ranges in a single values.batchGet request.
+
+    Returns a dict mapping each requested range to its list of rows.
+    """
+    value_ranges = sheet.client.sheet.values_batch_get(
+        sheet.id, ranges, major_dimension="ROWS"
+    )
+    # valueRanges come back in request order; the API normalizes the range
+    # strings, so key the result by the ranges we asked for
+    return {rng: vr.get("values", []) for rng, vr in zip(ranges, value_ranges)}
+
+
+def _digest_cache_path():
+    """Return the Parquet cache path for today's Daily Digest."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    return _digest_cache_dir / f"daily_digest_{today}.parquet"
+
+
+def load_cached_digest():
+    """Return today's Daily Digest from the local Parquet cache if it is fresh."""
+    path = _digest_cache_path()
+    if not path.exists() or time.time() - path.stat().st_mtime >= DIGEST_CACHE_TTL:
+        return None
+
+    import pandas as pd
+
+    try:
+        df = pd.read_parquet(path)
+        logging.info(f"Loaded {len(df)} articles from {path}")
+        return df
+    except Exception as e:
+        logging.warning(f"Could not read {path}: {e}")
+        return None
+
+
+def get_daily_digest_data(all_data):
+    """Build a DataFrame from the pre-fetched rows of today's Daily Digest sheet.
+
+    The result is also written to the local Parquet cache so re-runs on the
+    same day can skip the Sheets download.
+    """
+    import numpy as np
+    import pandas as pd
+
     try:
         # Get today's sheet name
         today = datetime.now().strftime("%Y-%m-%d")
         sheet_name = f"Daily Digest {today}"
 
-        # Try to get today's worksheet
-        try:
-            worksheet = sheet.worksheet_by_title(sheet_name)
-            logging.info(f"Found '{sheet_name}' worksheet")
-        except pygsheets.WorksheetNotFound:
+        if all_data is None:
             logging.error(f"'{sheet_name}' worksheet not found!")
             return None
 
-        # Get all data from the sheet
-        all_data = worksheet.get_all_values()
-
         if len(all_data) <= 1:  # Only header or empty
             logging.warning(f"No data found in '{sheet_name}' worksheet")
             return None
 
-        # Convert to DataFrame for easier handling
-        headers = all_data[0]
-        data_rows = all_data[1:]
-        df = pd.DataFrame(data_rows, columns=headers)
+        # batchGet trims trailing empty cells, so pad rows to the header width
+        # to get a rectangular 2-D array for the DataFrame constructor
+        width = len(all_data[0])
+        arr = np.asarray(
+            [row[:width] + [""] * (width - len(row)) for row in all_data],
+            dtype=object,
+        )
+        df = pd.DataFrame(arr[1:], columns=arr[0].tolist())
+        # Release the padded array before the OpenAI call; the rows themselves
+        # are still referenced by the caller
+        del arr
 
         logging.info(f"Retrieved {len(df)} articles from '{sheet_name}'")
+
+        try:
+            path = _digest_cache_path()
+            path.parent.mkdir(exist_ok=True)
+            df.to_parquet(path, engine="pyarrow", compression="zstd")
+        except Exception as e:
+            logging.warning(f"Could not cache daily digest: {e}")
+
         return df
 
     except Exception as e:
@@ -70,50 +181,130 @@ def get_daily_digest_data(sheet):
         return None
 
 
-def generate_explainer_script(summaries_data):
-    """Generate a 60-second explainer script using OpenAI."""
+def _prompt_cache_file(system_message, user_message):
+    """Return the on-disk cache path for a prompt's completion."""
+    key = hashlib.sha256(f"{system_message}\n{user_message}".encode()).hexdigest()
+    return _cache_dir / f"{key}.txt"
+
+
+def _fresh_completion(system_message, user_message, stream_path):
+    """Stream a new OpenAI completion and store it in the disk cache.
+
+    If ``stream_path`` is given, each chunk is also flushed to that file as
+    it arrives.
+    """
+    stream = get_openai_client().chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": user_message},
+        ],
+        max_tokens=300,
+        temperature=0.5,
+        stream=True,
+    )
+    buf = io.StringIO()
+    local_f = open(stream_path, "w") if stream_path else None
     try:
-        # Prepare the summaries for the prompt
-        summaries_text = ""
-        for idx, row in summaries_data.iterrows():
-            category = row.get("Category", "Unknown")
-            keyword = row.get("Keyword", "Unknown")
-            headline = row.get("Headline", "Unknown")
-            summary = row.get("Summary", "No summary available")
-
-            summaries_text += f"\n{idx+1}. [{category} - {keyword}] {headline}\n   Summary: {summary}\n"
-
-        prompt = f"""
-        You are a U.S.-based political journalist creating a 60-second daily briefing for an audience deeply concerned with American democracy.
-
-        Use the following spreadsheet of today's U.S. news stories to identify and summarize the items with the biggest impact on democracy—this includes developments related to voting rights, elections, disinformation, political extremism, civil liberties, court decisions, legislation, government transparency, and the rule of law.
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            buf.write(delta)
+            if local_f:
+                local_f.write(delta)
+                local_f.flush()
+    finally:
+        if local_f:
+            local_f.close()
+    text = buf.getvalue().strip()
+
+    _cache_dir.mkdir(exist_ok=True)
+    _prompt_cache_file(system_message, user_message).write_text(text)
+    return text
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_completion(system_message, user_message, stream_path):
+    """Return the disk-cached completion for a prompt, generating it if missing."""
+    cache_file = _prompt_cache_file(system_message, user_message)
+    if cache_file.exists():
+        logging.info("Using cached OpenAI response")
+        return cache_file.read_text()
+    return _fresh_completion(system_message, user_message, stream_path)
+
+
+def complete_prompt(system_message, user_message, stream_path=None, refresh=False):
+    """Return the OpenAI completion for a prompt, reusing cached responses.
+
+    With ``refresh``, both the in-process and the disk cache are bypassed and
+    the new completion replaces the cached one on disk.
+    """
+    if refresh:
+        return _fresh_completion(system_message, user_message, stream_path)
+    return _cached_completion(system_message, user_message, stream_path)
+
+
+def generate_explainer_script(summaries_data, refresh=False):
+    """Generate a 60-second explainer script using OpenAI.
+
+    ``refresh`` bypasses the cached completions and always calls OpenAI.
+    """
+    import pandas as pd
 
-        Your task: Write a concise, compelling 60-second script summarizing the top U.S. democracy-impacting news of the day.
-
-        Tone: Clear, urgent, and accessible. Speak directly to a civically engaged but time-crunched audience.
-
-        Format:
-        - Start with a bold intro (e.g., "Today in American democracy…")
-        - Prioritize 3–4 stories with the clearest implications for democratic institutions or civil rights
-        - Use plain, powerful language—explain why each story matters
-        - End with a short wrap-up or call to attention ("We'll be tracking this," etc.)
-
-        Focus on U.S. stories first, but include significant international stories that impact global democracy if they're highly relevant.
+    try:
+        # Rank democracy-relevant categories first and cap the article count
+        # to keep the prompt small
+        priority = (
+            summaries_data["Category"]
+            .astype(str)
+            .str.contains(PRIORITY_CATEGORY_PATTERN, case=False, na=False)
+            if "Category" in summaries_data
+            else pd.Series(False, index=summaries_data.index)
+        )
+        summaries_data = (
+            pd.concat([summaries_data[priority], summaries_data[~priority]])
+            .head(MAX_PROMPT_ARTICLES)
+            .reset_index(drop=True)
+        )
 
-        Spreadsheet input:
-        {summaries_text}
+        # Prepare the summaries for the prompt
+        cols = summaries_data.reindex(
+            columns=["Category", "Keyword", "Headline", "Summary"]
+        ).fillna(
+            {
+                "Category": "Unknown",
+                "Keyword": "Unknown",
+                "Headline": "Unknown",
+                "Summary": "No summary available",
+            }
+        )
+        numbers = (cols.index.to_series() + 1).astype(str)
+        lines = (
+            "\n"
+            + numbers
+            + ". ["
+            + cols["Category"].astype(str)
+            + " - "
+            + cols["Keyword"].astype(str)
+            + "] "
+            + cols["Headline"].astype(str)
+            + "\n   Summary: "
+            + cols["Summary"].astype(str).str.slice(0, MAX_SUMMARY_CHARS)
+            + "\n"
+        )
+        summaries_text = "".join(lines.tolist())
 
-        Write your 60-second democracy briefing (approximately 150-160 words):
-        """
+        # Only the per-run data goes in the user message so the static
+        # system prefix stays eligible for OpenAI's prompt cache
+        user_message = _PROMPT_TEMPLATE.format(summaries_text=summaries_text)
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=300,
-            temperature=0.5,
+        script = complete_prompt(
+            STATIC_INSTRUCTIONS,
+            user_message,
+            stream_path=_local_copy_filename(),
+            refresh=refresh,
         )
-
-        script = response.choices[0].message.content.strip()
         logging.info("Successfully generated explainer script")
         return script
 
@@ -122,36 +313,82 @@ def generate_explainer_script(summaries_data):
         return None
 
 
-def save_explainer_script(sheet, script, summaries_count):
-    """Save the explainer script to the Explainer Script sheet."""
+def _row_data(values):
+    """Build a Sheets API RowData payload of plain string cells."""
+    return {"values": [{"userEnteredValue": {"stringValue": str(v)}} for v in values]}
+
+
+def _entry_row_data(date_str, script):
+    """Build the RowData for a dated entry, storing the Date as a real date.
+
+    Rows written with update_values are USER_ENTERED, which turns
+    "YYYY-MM-DD" into a date; this matches that so the column stays uniform.
+    """
+    # Sheets dates are day serial numbers counted from 1899-12-30
+    serial = (datetime.strptime(date_str, "%Y-%m-%d") - datetime(1899, 12, 30)).days
+    return {
+        "values": [
+            {
+                "userEnteredValue": {"numberValue": serial},
+                "userEnteredFormat": {
+                    "numberFormat": {"type": "DATE", "pattern": "yyyy-mm-dd"}
+                },
+            },
+            {"userEnteredValue": {"stringValue": str(script)}},
+        ]
+    }
+
+
+def save_explainer_script(sheet, script, summaries_count, all_data):
+    """Save the explainer script to the Explainer Script sheet.
+
+    ``all_data`` holds the pre-fetched Explainer Script rows (only the Date
+    column is used), so no extra read is issued before writing. Creating the
+    sheet, writing its header and appending today's row are sent as a single
+    batchUpdate.
+    """
     try:
         sheet_name = "Explainer Script"
+        requests_batch = []
 
-        # Try to get existing sheet or create new one
-        try:
-            worksheet = sheet.worksheet_by_title(sheet_name)
+        # Use the existing sheet or queue its creation
+        worksheets = {ws.title: ws for ws in sheet.worksheets()}
+        worksheet = worksheets.get(sheet_name)
+        if worksheet is not None:
             logging.info(f"Found existing '{sheet_name}' worksheet")
-            # Ensure the sheet has enough rows
-            if worksheet.rows < 1000:
-                worksheet.resize(rows=1000)
-                logging.info("Expanded worksheet to 1000 rows")
-        except pygsheets.WorksheetNotFound:
-            worksheet = sheet.add_worksheet(sheet_name, rows=1000, cols=10)
-            logging.info(f"Created new '{sheet_name}' worksheet")
-            # Add headers for new sheet
+            sheet_id = worksheet.id
+        else:
+            sheet_id = max((ws.id for ws in worksheets.values()), default=0) + 1
             headers = ["Date", "Explainer"]
-            worksheet.update_row(1, headers)
+            requests_batch.append(
+                {
+                    "addSheet": {
+                        "properties": {
+                            "sheetId": sheet_id,
+                            "title": sheet_name,
+                            "gridProperties": {"rowCount": 1000, "columnCount": 10},
+                        }
+                    }
+                }
+            )
+            requests_batch.append(
+                {
+                    "updateCells": {
+                        "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                        "rows": [_row_data(headers)],
+                        "fields": "userEnteredValue",
+                    }
+                }
+            )
+            all_data = [headers]
 
         # Get today's date
         today = datetime.now().strftime("%Y-%m-%d")
 
-        # Check if today's entry already exists
-        all_data = worksheet.get_all_values()
-        today_row = None
-        for i, row in enumerate(all_data):
-            if len(row) > 0 and row[0] == today:
-                today_row = i + 1  # 1-based indexing
-                break
+        # Look up today's row in the pre-fetched Date column
+        index = {row[0]: i for i, row in enumerate(all_data[1:], start=2) if row}
+        next_row = len(all_data) + 1
+        today_row = index.get(today)
 
         # Prepare the data to save
         data_row = [today, script]
@@ -159,18 +396,29 @@ def save_explainer_script(sheet, script, summaries_count):
         # Add or update today's entry
         if today_row:
             # Update existing entry
-            worksheet.update_row(today_row, data_row)
+            with_backoff(
+                lambda: worksheet.update_values(
+                    f"A{today_row}:B{today_row}", [data_row]
+                )
+            )
             logging.info(f"Updated existing entry for {today}")
         else:
-            # Add new entry using append_table which handles row positioning
-            try:
-                worksheet.append_table(data_row)
-                logging.info(f"Added new entry for {today}")
-            except Exception as e:
-                # Fallback to manual row insertion
-                next_row = len(all_data) + 1 if all_data else 2
-                worksheet.update_row(next_row, data_row)
-                logging.info(f"Added new entry for {today} at row {next_row}")
+            # appendCells grows the sheet as needed, so no resize is required
+            requests_batch.append(
+                {
+                    "appendCells": {
+                        "sheetId": sheet_id,
+                        "rows": [_entry_row_data(today, script)],
+                        "fields": "userEnteredValue,userEnteredFormat.numberFormat",
+                    }
+                }
+            )
+            with_backoff(
+                lambda: sheet.client.sheet.batch_update(sheet.id, requests_batch)
+            )
+            if worksheet is None:
+                logging.info(f"Created new '{sheet_name}' worksheet")
+            logging.info(f"Added new entry for {today} at row {next_row}")
 
         logging.info(f"Successfully saved explainer script to '{sheet_name}'")
         return True
@@ -180,9 +428,83 @@ def save_explainer_script(sheet, script, summaries_count):
         return False
 
 
-def main():
+def _local_copy_filename():
+    """Return the path of today's local explainer script copy."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    return f"explainer_script_{today}.txt"
+
+
+def _write_local_copy(script, count):
+    """Save a local text copy of today's explainer script.
+
+    This replaces the raw text streamed there during generation with the
+    finished copy and its header.
+    """
+    today = datetime.now().strftime("%Y-%m-%d")
+    filename = _local_copy_filename()
+    with open(filename, "w") as f:
+        f.write(f"Explainer Script for {today}\n")
+        f.write(f"Based on {count} articles\n")
+        f.write("=" * 60 + "\n\n")
+        f.write(script)
+
+    logging.info(f"Saved local copy to {filename}")
+
+
+def check_explainer_sheet(sheet):
+    """Check what's in the Explainer Script sheet."""
+    try:
+        worksheet = sheet.worksheet_by_title("Explainer Script")
+        print(f"Found 'Explainer Script' worksheet")
+
+        # Only the Date column is needed to count rows and find today
+        dates = worksheet.get_col(1, include_tailing_empty=False)
+        print(f"Total rows in sheet: {len(dates)}")
+
+        # Show first few rows
+        print("\nFirst 10 rows:")
+        for i, row in enumerate(worksheet.get_values("A1", "B10")):
+            print(f"Row {i+1}: {row}")
+
+        # Check for today's date
+        today = datetime.now().strftime("%Y-%m-%d")
+        print(f"\nLooking for today's date: {today}")
+
+        if today in dates:
+            row_number = dates.index(today) + 1
+            print(f"Found today's entry at row {row_number}: {today}")
+            script = worksheet.get_value(f"B{row_number}")
+            if script:
+                print(f"Script preview: {script[:100]}...")
+        else:
+            print("No entry found for today's date")
+
+    except Exception as e:
+        print(f"Error accessing Explainer Script sheet: {e}")
+
+
+def main(argv=None):
     """Main function to generate and save explainer script."""
-    logging.info("Starting explainer script generation...")
+    parser = argparse.ArgumentParser(
+        description="Generate today's 60-second explainer script."
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--generate",
+        action="store_true",
+        help="Generate and save today's explainer script (default)",
+    )
+    mode.add_argument(
+        "--check",
+        action="store_true",
+        help="Show what's in the Explainer Script sheet instead of generating",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate the script even if today's entry already exists",
+    )
+    args = parser.parse_args(argv)
 
     # Initialize Google Sheets
     sheet = init_google_sheet()
@@ -190,8 +512,47 @@ def main():
         logging.error("Failed to initialize Google Sheet. Exiting.")
         return
 
+    if args.check:
+        check_explainer_sheet(sheet)
+        return
+
+    logging.info("Starting explainer script generation...")
+
+    # A fresh local copy of today's digest saves downloading it again
+    cached_digest = load_cached_digest()
+
+    # Fetch today's digest and the existing explainer rows in one request
+    today = datetime.now().strftime("%Y-%m-%d")
+    digest_title = f"Daily Digest {today}"
+    explainer_title = "Explainer Script"
+    ranges = {
+        title: f"'{title}'!{cols}"
+        # Only the Date column of the explainer sheet is needed to find today
+        for title, cols in ((digest_title, "A:Z"), (explainer_title, "A:A"))
+    }
+    # batchGet fails as a whole on a missing tab, so only ask for existing ones
+    existing_titles = {ws.title for ws in sheet.worksheets()}
+    if cached_digest is not None:
+        existing_titles.discard(digest_title)
+    requested = [rng for title, rng in ranges.items() if title in existing_titles]
+    try:
+        bulk = fetch_sheets_bulk(sheet, requested) if requested else {}
+    except Exception as e:
+        logging.error(f"Error fetching sheet data: {e}")
+        return
+
+    # Skip the OpenAI call entirely if today's script is already saved
+    explainer_rows = bulk.get(ranges[explainer_title]) or []
+    existing_dates = {row[0] for row in explainer_rows[1:] if row}
+    if today in existing_dates and not args.force:
+        logging.info("Today's script already exists; skipping.")
+        return
+
     # Get today's daily digest data
-    daily_data = get_daily_digest_data(sheet)
+    if cached_digest is not None:
+        daily_data = cached_digest
+    else:
+        daily_data = get_daily_digest_data(bulk.get(ranges[digest_title]))
     if daily_data is None or daily_data.empty:
         logging.error("No daily digest data found. Exiting.")
         return
@@ -199,13 +560,25 @@ def main():
     logging.info(f"Processing {len(daily_data)} articles for explainer script")
 
     # Generate explainer script
-    script = generate_explainer_script(daily_data)
+    # --force asks for a new script, so skip the cached completions too
+    script = generate_explainer_script(daily_data, refresh=args.force)
     if not script:
         logging.error("Failed to generate explainer script. Exiting.")
         return
 
-    # Save the script to Google Sheets
-    success = save_explainer_script(sheet, script, len(daily_data))
+    # Save to Google Sheets and the local copy concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        fut_sheet = executor.submit(
+            save_explainer_script,
+            sheet,
+            script,
+            len(daily_data),
+            explainer_rows,
+        )
+        fut_local = executor.submit(_write_local_copy, script, len(daily_data))
+        success = fut_sheet.result()
+        fut_local.result()
+
     if success:
         logging.info("Explainer script generation completed successfully!")
         print("\n" + "=" * 60)
@@ -216,17 +589,6 @@ def main():
     else:
         logging.error("Failed to save explainer script.")
 
-    # Also save local copy
-    today = datetime.now().strftime("%Y-%m-%d")
-    filename = f"explainer_script_{today}.txt"
-    with open(filename, "w") as f:
-        f.write(f"Explainer Script for {today}\n")
-        f.write(f"Based on {len(daily_data)} articles\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(script)
-
-    logging.info(f"Saved local copy to {filename}")
-
 
 if __name__ == "__main__":
     main()
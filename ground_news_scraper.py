@@ -1,11 +1,17 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime, timedelta, timezone
 import pandas as pd
 import time
 import pygsheets
 import os
+import json
+import orjson
+import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from openai import OpenAI
 
 # Configure logging
@@ -24,6 +30,84 @@ HEADERS = {
     "x-gn-v": "web",
 }
 
+SEARCH_URL = "https://web-api-cdn.ground.news/api/public/search/url"
+
+# Concurrency limits for the async scrape: in-flight ground.news requests
+# and pooled connections
+MAX_CONCURRENT_REQUESTS = 10
+MAX_CONNECTIONS = 20
+# Sustained ground.news request rate; short bursts up to this many are allowed
+MAX_REQUESTS_PER_SECOND = 5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Longest Retry-After wait honored; the request keeps its throttle slot meanwhile
+MAX_RETRY_AFTER = 60
+# Article pages are read up to this size and parsed for these tags only
+MAX_ARTICLE_BYTES = 512 * 1024
+ARTICLE_STRAINER = SoupStrainer(["h1", "meta", "div", "span", "p"])
+# Source badge class on ground.news article pages
+SOURCE_DIV_CLASS = (
+    "flex font-bold bg-light-light dark:bg-tertiary-light dark:text-dark-primary "
+    "rounded-full px-[0.6rem] py-[5px] gap-[8px] items-center shrink-0"
+)
+# Fallback source containers, matched in a single tree walk each
+SOURCE_SELECTOR = (
+    ".source, .publication, .article-source, .publisher, .source-attribution, "
+    ".byline, .source-container, .publisher-name, .source-name, .source-link, "
+    ".primary-source, .article-meta"
+)
+SOURCE_SUBSTRING_SELECTOR = (
+    'span[class*="source" i], div[class*="publisher" i], span[class*="byline" i]'
+)
+# Markdown bold markers and headings stripped from OpenAI output
+MD_STRIP_RE = re.compile(r"\*\*|#{1,3} ?")
+# Outlets whose coverage settles the US filter without asking OpenAI
+US_SOURCES = frozenset(
+    {
+        "cnn",
+        "nyt",
+        "new york times",
+        "the new york times",
+        "fox news",
+        "ap",
+        "ap news",
+        "associated press",
+        "npr",
+        "washington post",
+        "the washington post",
+        "politico",
+        "axios",
+        "the hill",
+        "nbc news",
+        "abc news",
+        "cbs news",
+        "usa today",
+        "wall street journal",
+        "the wall street journal",
+    }
+)
+NON_US_SOURCES = frozenset(
+    {
+        "bbc",
+        "bbc news",
+        "al jazeera",
+        "reuters uk",
+        "rt",
+        "xinhua",
+        "dw",
+        "france 24",
+        "the guardian uk",
+        "times of india",
+        "south china morning post",
+        "cbc news",
+    }
+)
+# Digest rows written to the sheet per request
+SHEET_WRITE_BATCH_SIZE = 200
+# Articles classified per OpenAI request by the US filter, and how many
+# of those requests may run while scraping continues
+US_FILTER_BATCH_SIZE = 25
+US_FILTER_WORKERS = 4
+
 # Initialize OpenAI client
 openai_client = None
 try:
@@ -69,31 +153,33 @@ except Exception as e:
 _cached_keywords = None
 _cached_prompts = None
 _cache_timestamp = None
+_prompts_cache_ts = None
 CACHE_DURATION = 300  # 5 minutes in seconds
 
 
+@lru_cache(maxsize=1)
 def get_google_client():
-    """Get authenticated Google Sheets client."""
+    """Get authenticated Google Sheets client, authorizing once per process."""
     google_creds = os.getenv("GOOGLE_CREDENTIALS_JSON")
     if google_creds:
-        import json
-        import tempfile
-
-        # Create temporary credentials file from environment variable
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as temp_file:
-            temp_file.write(google_creds)
-            temp_creds_path = temp_file.name
-        client = pygsheets.authorize(service_file=temp_creds_path)
-        # Clean up temp file
-        os.unlink(temp_creds_path)
-        return client
+        from google.oauth2 import service_account
+
+        # Build credentials directly from the environment variable's JSON
+        creds = service_account.Credentials.from_service_account_info(
+            json.loads(google_creds), scopes=pygsheets.authorization._SCOPES
+        )
+        return pygsheets.authorize(custom_credentials=creds)
     else:
         # Fall back to local credentials file
         return pygsheets.authorize(service_file="credentials.json")
 
 
+@lru_cache(maxsize=1)
+def get_spreadsheet():
+    """Open the Maya News Extraction spreadsheet once per process."""
+    return get_google_client().open("Maya News Extraction")
+
+
 def load_keywords_from_sheet():
     """Load keywords and categories from Google Sheets with caching."""
     global _cached_keywords, _cache_timestamp
@@ -109,20 +195,24 @@ def load_keywords_from_sheet():
         return _cached_keywords
 
     try:
-        client = get_google_client()
-        sheet = client.open("Maya News Extraction")
+        sheet = get_spreadsheet()
 
         try:
             worksheet = sheet.worksheet_by_title("Keywords")
-            # Get all data from the Keywords sheet
-            data = worksheet.get_all_records()
+            # Get all data from the Keywords sheet as plain rows
+            header, *rows = worksheet.get_all_values(
+                include_tailing_empty_rows=False, returnas="matrix"
+            )
+            active_col = header.index("Active")
+            category_col = header.index("Category")
+            keyword_col = header.index("Keyword")
 
             # Build categories dictionary from sheet data
             categories = {}
-            for row in data:
-                if row.get("Active", "").upper() == "TRUE":
-                    category = row.get("Category", "")
-                    keyword = row.get("Keyword", "")
+            for row in rows:
+                if row[active_col].upper() == "TRUE":
+                    category = row[category_col]
+                    keyword = row[keyword_col]
                     if category and keyword:
                         if category not in categories:
                             categories[category] = []
@@ -151,92 +241,84 @@ def load_keywords_from_sheet():
 
 
 def load_prompts_from_sheet():
-    """Load OpenAI prompts from Google Sheets."""
+    """Load OpenAI prompts from Google Sheets with caching."""
+    global _cached_prompts, _prompts_cache_ts
+
+    # Check if cache is still valid
+    current_time = time.time()
+    if (
+        _cached_prompts is not None
+        and _prompts_cache_ts is not None
+        and current_time - _prompts_cache_ts < CACHE_DURATION
+    ):
+        logging.debug("Using cached prompts")
+        return _cached_prompts
+
     try:
-        client = get_google_client()
-        sheet = client.open("Maya News Extraction")
+        sheet = get_spreadsheet()
 
         try:
             worksheet = sheet.worksheet_by_title("Prompts")
-            # Get all data from the Prompts sheet
-            data = worksheet.get_all_records()
+            # Get all data from the Prompts sheet as plain rows
+            header, *rows = worksheet.get_all_values(
+                include_tailing_empty_rows=False, returnas="matrix"
+            )
+            active_col = header.index("Active")
+            name_col = header.index("Prompt Name")
+            text_col = header.index("Prompt Text")
 
             # Build prompts dictionary from sheet data
             prompts = {}
-            for row in data:
-                if row.get("Active", "").upper() == "TRUE":
-                    prompt_name = row.get("Prompt Name", "")
-                    prompt_text = row.get("Prompt Text", "")
+            for row in rows:
+                if row[active_col].upper() == "TRUE":
+                    prompt_name = row[name_col]
+                    prompt_text = row[text_col]
                     if prompt_name and prompt_text:
                         prompts[prompt_name] = prompt_text
 
+            # Cache the results
+            _cached_prompts = prompts
+            _prompts_cache_ts = current_time
+
             logging.info(f"Loaded {len(prompts)} prompts from Prompts sheet")
             return prompts
 
         except pygsheets.WorksheetNotFound:
             logging.warning("Prompts sheet not found, using fallback prompts")
-            return get_fallback_prompts()
+            fallback = get_fallback_prompts()
+            _cached_prompts = fallback
+            _prompts_cache_ts = current_time
+            return fallback
 
     except Exception as e:
         logging.error(f"Error loading prompts from sheet: {e}")
-        return get_fallback_prompts()
+        fallback = get_fallback_prompts()
+        _cached_prompts = fallback
+        _prompts_cache_ts = current_time
+        return fallback
 
 
 def get_fallback_categories():
     """Fallback categories if Google Sheets is unavailable."""
-    return {
-        "Press & Information Freedom": [
-            "press freedom",
-            "journalist arrested",
-            "book ban",
-            "disinformation",
-        ],
-        "Voting Rights & Election Integrity": [
-            "voter suppression",
-            "gerrymandering",
-            "election interference",
-        ],
-        "Judicial & Legal Integrity": [
-            "court independence",
-            "due process",
-            "rule of law",
-        ],
-    }
+    # Same keywords the setup script writes to the Keywords sheet
+    from setup_keywords_sheet import CATEGORIES
+
+    return CATEGORIES
 
 
 def get_fallback_prompts():
     """Fallback prompts if Google Sheets is unavailable."""
-    return {
-        "Explainer Script": (
-            "You are a U.S.-based political journalist creating a 60-second "
-            "daily briefing for an audience deeply concerned with American "
-            "democracy. Write a concise, compelling script summarizing the "
-            "top U.S. democracy-impacting news of the day. Start with "
-            "'Today in American democracy...' and prioritize 3-4 stories. "
-            "Spreadsheet input: {summaries_text}"
-        ),
-        "One Sheet Briefing": (
-            "Create a comprehensive one-sheet briefing document covering "
-            "the most critical democracy-related news. Organize into "
-            "thematic sections and focus on democratic institutions impact. "
-            "Spreadsheet input: {summaries_text}"
-        ),
-        "US Article Filter": (
-            "Determine if this news article is about United States domestic "
-            "news or politics. Return 'YES' for US domestic news, 'NO' for "
-            "international. Article: Headline: {headline}, "
-            "Summary: {summary}, Source: {source}"
-        ),
-    }
+    # Same prompts the setup script writes to the Prompts sheet
+    from setup_prompts_sheet import PROMPTS_DATA
+
+    return {name: text for name, text, _active in PROMPTS_DATA[1:]}
 
 
 def init_google_sheet():
     """Initialize Google Sheets client and open the Maya News Extraction spreadsheet."""
     try:
-        # Authorize with service account credentials
-        client = get_google_client()
-        # Open the spreadsheet by name
-        sheet = client.open("Maya News Extraction")
+        # Authorize and open the spreadsheet (shared with the config loaders)
+        sheet = get_spreadsheet()
 
         # Create daily sheet name with current date
         today = datetime.now().strftime("%Y-%m-%d")
@@ -257,19 +339,129 @@ def init_google_sheet():
         return None
 
 
-def post_with_retry(url, headers, json_data, retries=3, delay=3):
+class RequestThrottle:
+    """Limit in-flight ground.news requests and their rate with a token bucket.
+
+    Used as ``async with throttle:`` around each request. Requests only wait
+    when the concurrency or the per-second limit would be exceeded.
+    """
+
+    def __init__(self, max_concurrent, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            async with self.lock:
+                while True:
+                    now = time.monotonic()
+                    self.tokens = min(
+                        self.rate, self.tokens + (now - self.updated) * self.rate
+                    )
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return self
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+        except BaseException:
+            # Cancelled while waiting for a token
+            self.semaphore.release()
+            raise
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+
+
+async def _request_with_retry(
+    session, method, url, retries=3, delay=1, max_bytes=None, **kwargs
+):
+    """Send a ground.news request, retrying 429/5xx and network errors with backoff.
+
+    If max_bytes is set, the body is streamed and truncated at that size.
+    """
     for attempt in range(retries):
         try:
-            response = requests.post(url, headers=headers, json=json_data, timeout=10)
-            response.raise_for_status()
-            return response
-        except requests.RequestException as e:
-            logging.warning(f"Attempt {attempt+1} failed for '{json_data['url']}': {e}")
-            time.sleep(delay)
+            async with session.request(method, url, **kwargs) as response:
+                if response.status in RETRY_STATUSES and attempt < retries - 1:
+                    # Honor the server's Retry-After hint when rate limited
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        delay = min(int(retry_after), MAX_RETRY_AFTER)
+                        logging.warning(
+                            f"Rate limited on '{url}', retrying in {delay}s"
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    raise aiohttp.ClientResponseError(
+                        response.request_info,
+                        response.history,
+                        status=response.status,
+                        message=response.reason,
+                    )
+                response.raise_for_status()
+                if max_bytes is None:
+                    return await response.read()
+
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    body += chunk
+                    if len(body) >= max_bytes:
+                        break
+                return bytes(body[:max_bytes])
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.warning(f"Attempt {attempt+1} failed for '{url}': {e}")
+            if attempt < retries - 1:
+                await asyncio.sleep(delay * 2**attempt)
     return None
 
 
-def generate_explainer_script(daily_data):
+async def fetch_search(session, keyword):
+    """Search ground.news for a keyword and return the parsed JSON response."""
+    body = await _request_with_retry(session, "POST", SEARCH_URL, json={"url": keyword})
+    if body is None:
+        return None
+    try:
+        return orjson.loads(body)
+    except ValueError as e:
+        logging.error(f"Invalid search response for keyword '{keyword}': {e}")
+        return None
+
+
+async def fetch_article(session, slug):
+    """Fetch the HTML of a ground.news article page."""
+    body = await _request_with_retry(
+        session,
+        "GET",
+        f"https://ground.news/article/{slug}",
+        params={"_rsc": "19oxi"},
+        max_bytes=MAX_ARTICLE_BYTES,
+    )
+    return body.decode("utf-8", errors="replace") if body is not None else None
+
+
+def _build_summaries(daily_data):
+    """Format the day's articles as the numbered list both prompts expect."""
+    d = daily_data.fillna(
+        {
+            "Category": "Unknown",
+            "Keyword": "Unknown",
+            "Headline": "Unknown",
+            "Summary": "No summary available",
+        }
+    ).astype({"Category": str, "Keyword": str, "Headline": str, "Summary": str})
+    numbers = pd.Series(d.index + 1, index=d.index).astype(str)
+    lines = (
+        "\n" + numbers + ". [" + d["Category"] + " - " + d["Keyword"] + "] "
+        + d["Headline"] + "\n   Summary: " + d["Summary"] + "\n"
+    )
+    return "".join(lines)
+
+
+def generate_explainer_script(daily_data, prompts=None, summaries_text=None):
     """Generate a 60-second explainer script using OpenAI."""
     try:
         # Check if OpenAI client is available
@@ -279,18 +471,13 @@ def generate_explainer_script(daily_data):
             )
             return None
 
-        # Load prompts from Google Sheets
-        prompts = load_prompts_from_sheet()
-
-        # Prepare the summaries for the prompt
-        summaries_text = ""
-        for idx, row in daily_data.iterrows():
-            category = row.get("Category", "Unknown")
-            keyword = row.get("Keyword", "Unknown")
-            headline = row.get("Headline", "Unknown")
-            summary = row.get("Summary", "No summary available")
+        # Load prompts from Google Sheets unless the caller already has them
+        if prompts is None:
+            prompts = load_prompts_from_sheet()
 
-            summaries_text += f"\n{idx+1}. [{category} - {keyword}] {headline}\n   Summary: {summary}\n"
+        # Prepare the summaries for the prompt unless the caller already has them
+        if summaries_text is None:
+            summaries_text = _build_summaries(daily_data)
 
         # Get the explainer script prompt from Google Sheets
         prompt_template = prompts.get(
@@ -305,10 +492,8 @@ def generate_explainer_script(daily_data):
             temperature=0.5,
         )
 
-        script = response.choices[0].message.content.strip()
         # Clean up any markdown formatting
-        script = script.replace("**", "").replace("##", "").replace("###", "")
-        script = script.replace("# ", "").strip()
+        script = MD_STRIP_RE.sub("", response.choices[0].message.content).strip()
         logging.info("Successfully generated explainer script")
         return script
 
@@ -317,7 +502,7 @@ def generate_explainer_script(daily_data):
         return None
 
 
-def generate_one_sheet(daily_data):
+def generate_one_sheet(daily_data, prompts=None, summaries_text=None):
     """Generate a longer one-sheet news summary using OpenAI."""
     try:
         # Check if OpenAI client is available
@@ -327,18 +512,13 @@ def generate_one_sheet(daily_data):
             )
             return None
 
-        # Load prompts from Google Sheets
-        prompts = load_prompts_from_sheet()
-
-        # Prepare the summaries for the prompt
-        summaries_text = ""
-        for idx, row in daily_data.iterrows():
-            category = row.get("Category", "Unknown")
-            keyword = row.get("Keyword", "Unknown")
-            headline = row.get("Headline", "Unknown")
-            summary = row.get("Summary", "No summary available")
+        # Load prompts from Google Sheets unless the caller already has them
+        if prompts is None:
+            prompts = load_prompts_from_sheet()
 
-            summaries_text += f"\n{idx+1}. [{category} - {keyword}] {headline}\n   Summary: {summary}\n"
+        # Prepare the summaries for the prompt unless the caller already has them
+        if summaries_text is None:
+            summaries_text = _build_summaries(daily_data)
 
         # Get the one-sheet briefing prompt from Google Sheets
         prompt_template = prompts.get(
@@ -353,10 +533,8 @@ def generate_one_sheet(daily_data):
             temperature=0.5,
         )
 
-        one_sheet = response.choices[0].message.content.strip()
         # Clean up any markdown formatting
-        one_sheet = one_sheet.replace("**", "").replace("##", "").replace("###", "")
-        one_sheet = one_sheet.replace("# ", "").strip()
+        one_sheet = MD_STRIP_RE.sub("", response.choices[0].message.content).strip()
         logging.info("Successfully generated one-sheet briefing")
         return one_sheet
 
@@ -365,171 +543,171 @@ def generate_one_sheet(daily_data):
         return None
 
 
-def save_explainer_script(sheet, script):
-    """Save the explainer script to the Explainer Script sheet."""
-    try:
-        sheet_name = "Explainer Script"
+def prepare_daily_row_update(sheet, sheet_name, header, value):
+    """Locate today's row in a daily output sheet, creating the sheet if needed.
 
+    Returns a ValueRange dict for save_daily_outputs, or None on error.
+    """
+    try:
         # Try to get existing sheet or create new one
         try:
             worksheet = sheet.worksheet_by_title(sheet_name)
             logging.info(f"Found existing '{sheet_name}' worksheet")
-            # Ensure the sheet has enough rows
-            if worksheet.rows < 1000:
-                worksheet.resize(rows=1000)
-                logging.info("Expanded worksheet to 1000 rows")
         except pygsheets.WorksheetNotFound:
             worksheet = sheet.add_worksheet(sheet_name, rows=1000, cols=10)
             logging.info(f"Created new '{sheet_name}' worksheet")
             # Add headers for new sheet
-            headers = ["Date", "Explainer"]
-            worksheet.update_row(1, headers)
+            worksheet.update_row(1, header)
 
         # Get today's date
         today = datetime.now().strftime("%Y-%m-%d")
 
-        # Check if today's entry already exists and find next available row
-        all_data = worksheet.get_all_values()
-        today_row = None
-        last_data_row = 1  # Start after header row
-
-        for i, row in enumerate(all_data):
-            if len(row) > 0 and any(cell.strip() for cell in row):  # Non-empty row
-                last_data_row = i + 1  # 1-based indexing
-                if row[0] == today:
-                    today_row = i + 1
-                    break
+        # Check if today's entry already exists and find next available row;
+        # only the date column is needed for that
+        dates = worksheet.get_col(1, include_tailing_empty=False)
+        today_row = dates.index(today) + 1 if today in dates else None
+        last_data_row = max(len(dates), 1)  # At least the header row
 
-        # Prepare the data to save
-        data_row = [today, script]
-
-        # Add or update today's entry
+        # Update today's existing entry or add one after the last data row
         if today_row:
-            # Update existing entry
-            worksheet.update_row(today_row, data_row)
-            logging.info(f"Updated existing explainer script for {today}")
+            logging.info(f"Updating existing '{sheet_name}' entry for {today}")
         else:
-            # Add new entry to the next available row after last data
-            next_row = last_data_row + 1
-            worksheet.update_row(next_row, data_row)
-            logging.info(f"Added new explainer script for {today} at row {next_row}")
+            today_row = last_data_row + 1
+            logging.info(
+                f"Adding new '{sheet_name}' entry for {today} at row {today_row}"
+            )
 
-        logging.info(f"Successfully saved explainer script to '{sheet_name}'")
-        return True
+        return {
+            "range": f"'{sheet_name}'!A{today_row}:B{today_row}",
+            "values": [[today, value]],
+        }
 
     except Exception as e:
-        logging.error(f"Error saving explainer script: {e}")
-        return False
+        logging.error(f"Error preparing '{sheet_name}' entry: {e}")
+        return None
 
 
-def save_one_sheet(sheet, one_sheet):
-    """Save the one-sheet briefing to the One Sheet sheet."""
+def save_daily_outputs(sheet, updates):
+    """Write all prepared daily output rows in one values.batchUpdate request."""
     try:
-        sheet_name = "One Sheet"
-
-        # Try to get existing sheet or create new one
-        try:
-            worksheet = sheet.worksheet_by_title(sheet_name)
-            logging.info(f"Found existing '{sheet_name}' worksheet")
-            # Ensure the sheet has enough rows
-            if worksheet.rows < 1000:
-                worksheet.resize(rows=1000)
-                logging.info("Expanded worksheet to 1000 rows")
-        except pygsheets.WorksheetNotFound:
-            worksheet = sheet.add_worksheet(sheet_name, rows=1000, cols=10)
-            logging.info(f"Created new '{sheet_name}' worksheet")
-            # Add headers for new sheet
-            headers = ["Date", "One Sheet Briefing"]
-            worksheet.update_row(1, headers)
-
-        # Get today's date
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        # Check if today's entry already exists and find next available row
-        all_data = worksheet.get_all_values()
-        today_row = None
-        last_data_row = 1  # Start after header row
-
-        for i, row in enumerate(all_data):
-            if len(row) > 0 and any(cell.strip() for cell in row):  # Non-empty row
-                last_data_row = i + 1  # 1-based indexing
-                if row[0] == today:
-                    today_row = i + 1
-                    break
-
-        # Prepare the data to save
-        data_row = [today, one_sheet]
-
-        # Add or update today's entry
-        if today_row:
-            # Update existing entry
-            worksheet.update_row(today_row, data_row)
-            logging.info(f"Updated existing one-sheet for {today}")
-        else:
-            # Add new entry to the next available row after last data
-            next_row = last_data_row + 1
-            worksheet.update_row(next_row, data_row)
-            logging.info(f"Added new one-sheet for {today} at row {next_row}")
-
-        logging.info(f"Successfully saved one-sheet to '{sheet_name}'")
+        sheet.client.sheet.values_batch_update(sheet.id, {"data": updates})
+        logging.info(f"Saved {len(updates)} daily outputs in one batch update")
         return True
-
     except Exception as e:
-        logging.error(f"Error saving one-sheet: {e}")
+        logging.error(f"Error saving daily outputs: {e}")
         return False
 
 
-def is_us_based_article(headline, summary, source):
-    """Use OpenAI to determine if article is US-based news."""
-    try:
-        # Check if OpenAI client is available
-        if openai_client is None:
-            logging.warning("OpenAI client not available, including all articles")
-            return True
+def classify_by_source(source):
+    """Return True/False when every listed source is a known US/non-US outlet.
 
-        # Load prompts from Google Sheets
-        prompts = load_prompts_from_sheet()
+    Returns None when the sources are mixed or unknown, so the article has
+    to be classified by OpenAI.
+    """
+    names = {name.strip().lower() for name in source.split(",") if name.strip()}
+    if not names:
+        return None
+    if names <= US_SOURCES:
+        return True
+    if names <= NON_US_SOURCES:
+        return False
+    return None
 
-        # Get the US article filter prompt from Google Sheets
-        prompt_template = prompts.get(
-            "US Article Filter", get_fallback_prompts()["US Article Filter"]
-        )
-        prompt = prompt_template.format(
-            headline=headline, summary=summary, source=source
-        )
 
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=10,
-            temperature=0.1,
-        )
+def classify_us_articles(articles, prompts=None):
+    """Use OpenAI to flag which articles are US-based news.
 
-        result = response.choices[0].message.content.strip().upper()
-        # Clean up any markdown formatting
-        result = result.replace("**", "").replace("##", "").replace("#", "").strip()
+    articles is a list of (headline, summary, source) tuples; returns one
+    bool per article. Articles not settled by classify_by_source are sent in
+    batches of US_FILTER_BATCH_SIZE so each request classifies many at once.
+    """
+    # Settle articles from well-known outlets without an OpenAI request
+    decisions = [classify_by_source(source) for _, _, source in articles]
+    pending = [i for i, decision in enumerate(decisions) if decision is None]
+    logging.info(
+        f"Classified {len(articles) - len(pending)} of {len(articles)} articles by source"
+    )
+    if not pending:
+        return decisions
 
-        if result == "YES":
-            return True
-        elif result == "NO":
-            return False
-        else:
-            # If unclear response, default to including the article
-            logging.warning(f"Unclear OpenAI response for US filtering: '{result}'")
-            return True
+    # Check if OpenAI client is available
+    if openai_client is None:
+        logging.warning("OpenAI client not available, including all articles")
+        return [decision is not False for decision in decisions]
 
-    except Exception as e:
-        logging.error(f"Error with OpenAI US filtering: {e}")
-        # If OpenAI fails, default to including the article
-        return True
+    # Load prompts from Google Sheets unless the caller already has them
+    if prompts is None:
+        prompts = load_prompts_from_sheet()
 
+    # Get the batch US article filter prompt from Google Sheets
+    prompt_template = prompts.get("US Article Filter Batch")
+    if prompt_template is None:
+        # Sheets set up before the batch filter still carry the old
+        # single-article "US Article Filter" row, which is no longer read
+        if "US Article Filter" in prompts:
+            logging.warning(
+                "Prompts sheet has 'US Article Filter' but no 'US Article Filter "
+                "Batch' row; using the built-in batch prompt. Re-run "
+                "setup_prompts_sheet.py or add the row to customize it."
+            )
+        prompt_template = get_fallback_prompts()["US Article Filter Batch"]
 
-def extract_summary(slug):
+    # The template goes through str.format, so literal braces must be doubled;
+    # fall back to the built-in prompt rather than failing every batch
+    try:
+        prompt_template.format(articles_text="")
+    except (KeyError, ValueError, IndexError) as e:
+        logging.warning(
+            f"Invalid 'US Article Filter Batch' prompt ({e!r}); using the "
+            "built-in batch prompt. Double any literal braces in the sheet."
+        )
+        prompt_template = get_fallback_prompts()["US Article Filter Batch"]
+
+    for start in range(0, len(pending), US_FILTER_BATCH_SIZE):
+        batch_ids = pending[start : start + US_FILTER_BATCH_SIZE]
+        batch = [articles[i] for i in batch_ids]
+        articles_text = "".join(
+            f"\n{i}. Headline: {headline}\n   Summary: {summary}\n   Source: {source}"
+            for i, (headline, summary, source) in enumerate(batch, start=1)
+        )
+        try:
+            prompt = prompt_template.format(articles_text=articles_text)
+            response = openai_client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=20 + 5 * len(batch),
+                temperature=0.1,
+                response_format={"type": "json_object"},
+            )
+            results = orjson.loads(response.choices[0].message.content)["results"]
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"expected {len(batch)} decisions, got {len(results)}"
+                )
+        except Exception as e:
+            logging.error(f"Error with OpenAI US filtering: {e}")
+            # If OpenAI fails, default to including the articles
+            for i in batch_ids:
+                decisions[i] = True
+            continue
+
+        for i, (headline, _, _), result in zip(batch_ids, batch, results):
+            result = str(result).strip().upper()
+            if result not in ("YES", "NO"):
+                # If unclear response, default to including the article
+                logging.warning(
+                    f"Unclear OpenAI response for US filtering of '{headline}': '{result}'"
+                )
+            decisions[i] = result != "NO"
+
+    return decisions
+
+
+def extract_summary(html, slug):
+    """Extract headline, summary, URL and sources from an article page."""
     try:
         article_url = f"https://ground.news/article/{slug}"
-        params = {"_rsc": "19oxi"}
-        r = requests.get(article_url, params=params, headers=HEADERS, timeout=10)
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(html, "lxml", parse_only=ARTICLE_STRAINER)
 
         # Extract headline
         headline_elem = (
@@ -540,10 +718,7 @@ def extract_summary(slug):
         headline = headline_elem.get_text(strip=True) if headline_elem else ""
 
         # Extract all sources using comprehensive method from nick.py
-        source_divs = soup.find_all(
-            "div",
-            class_="flex font-bold bg-light-light dark:bg-tertiary-light dark:text-dark-primary rounded-full px-[0.6rem] py-[5px] gap-[8px] items-center shrink-0",
-        )
+        source_divs = soup.find_all("div", class_=SOURCE_DIV_CLASS)
         sources = []
         for div in source_divs:
             source_span = div.find("span")
@@ -554,22 +729,8 @@ def extract_summary(slug):
 
         # Fallback: Try other source containers or links
         if not sources:
-            source_elems = (
-                soup.find_all(class_="source")
-                or soup.find_all(class_="publication")
-                or soup.find_all(class_="article-source")
-                or soup.find_all(class_="publisher")
-                or soup.find_all(class_="source-attribution")
-                or soup.find_all(class_="byline")
-                or soup.find_all(class_="source-container")
-                or soup.find_all(class_="publisher-name")
-                or soup.find_all(class_="source-name")
-                or soup.find_all(class_="source-link")
-                or soup.find_all(class_="primary-source")
-                or soup.find_all(class_="article-meta")
-                or soup.find_all("span", class_=lambda x: x and "source" in x.lower())
-                or soup.find_all("div", class_=lambda x: x and "publisher" in x.lower())
-                or soup.find_all("span", class_=lambda x: x and "byline" in x.lower())
+            source_elems = soup.select(SOURCE_SELECTOR) or soup.select(
+                SOURCE_SUBSTRING_SELECTOR
             )
             for elem in source_elems:
                 source_text = elem.get_text(strip=True)
@@ -598,6 +759,137 @@ def extract_summary(slug):
         return "", "", "", ""
 
 
+def flush_rows(worksheet, rows, start_row):
+    """Write buffered digest rows starting at start_row and clear the buffer.
+
+    Returns the next free row. On failure the rows are dropped and the same
+    start_row is returned, so later rows do not leave a gap.
+    """
+    end_row = start_row + len(rows) - 1
+    try:
+        worksheet.update_values(crange=f"A{start_row}:H{end_row}", values=rows)
+        logging.info(
+            f"Added {len(rows)} articles to Google Sheet (rows {start_row}-{end_row})"
+        )
+        start_row = end_row + 1
+    except Exception as e:
+        logging.error(f"Error adding to Google Sheet: {e}")
+    rows.clear()
+    return start_row
+
+
+async def process_event(session, sem, category, keyword, date, slug, existing_urls):
+    """Fetch and parse one search result; return its data or None."""
+    # Skip if URL already exists; the URL follows from the slug, so known
+    # articles are never fetched
+    if f"https://ground.news/article/{slug}" in existing_urls:
+        logging.info(f"Skipping duplicate article: {slug}")
+        return None
+
+    async with sem:
+        html = await fetch_article(session, slug)
+    if html is None:
+        return None
+    headline, summary, article_url, source = extract_summary(html, slug)
+    return category, keyword, date, headline, summary, article_url, source
+
+
+async def scrape_keyword(session, sem, category, keyword, cutoff_str, existing_urls):
+    """Search one keyword and process its recent events concurrently."""
+    logging.info(f"Searching: {keyword} in category {category}")
+    async with sem:
+        json_data = await fetch_search(session, keyword)
+    if not json_data:
+        return []
+
+    try:
+        events = []
+        for item in json_data.get("searchResults", []):
+            if item.get("type") == "event":
+                # UTC ISO-8601 timestamps sort lexicographically, so old
+                # events are skipped without parsing their dates
+                date_str = item.get("start", "")
+                if not date_str or date_str < cutoff_str:
+                    continue
+                date = datetime.fromisoformat(date_str.replace("Z", "")).replace(
+                    tzinfo=timezone.utc
+                )
+                events.append((date, item.get("slug", "")))
+
+        processed = await asyncio.gather(
+            *[
+                process_event(
+                    session, sem, category, keyword, date, slug, existing_urls
+                )
+                for date, slug in events
+            ]
+        )
+        return [article for article in processed if article]
+    except Exception as e:
+        logging.error(f"Error processing {keyword}: {e}")
+        return []
+
+
+async def scrape_all(categories, cutoff_str, existing_urls, prompts):
+    """Scrape every keyword and US-filter new articles as they arrive.
+
+    Returns (article, is_us) pairs. Classification batches run in a thread
+    pool while the remaining keywords are still being fetched.
+    """
+    loop = asyncio.get_running_loop()
+    sem = RequestThrottle(MAX_CONCURRENT_REQUESTS, MAX_REQUESTS_PER_SECOND)
+    candidates = []
+    classifying = []
+
+    with ThreadPoolExecutor(max_workers=US_FILTER_WORKERS) as classify_pool:
+
+        def submit(batch):
+            # Filter for US-based articles only (blocking OpenAI calls, off-loop)
+            texts = [(article[3], article[4], article[6]) for article in batch]
+            future = loop.run_in_executor(
+                classify_pool, classify_us_articles, texts, prompts
+            )
+            classifying.append((batch, future))
+
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS, ttl_dns_cache=300),
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as session:
+            tasks = [
+                scrape_keyword(
+                    session, sem, category, keyword, cutoff_str, existing_urls
+                )
+                for category, keywords in categories.items()
+                for keyword in keywords
+            ]
+            for task in asyncio.as_completed(tasks):
+                # One failing keyword must not abort the rest of the run
+                try:
+                    articles = await task
+                except Exception as e:
+                    logging.error(f"Error scraping keyword: {e}")
+                    continue
+                for article in articles:
+                    # Two keywords can surface the same article within one run
+                    article_url = article[5]
+                    if article_url in existing_urls:
+                        logging.info(f"Skipping duplicate article: {article_url}")
+                        continue
+                    existing_urls.add(article_url)
+                    candidates.append(article)
+                    if len(candidates) >= US_FILTER_BATCH_SIZE:
+                        submit(candidates)
+                        candidates = []
+        if candidates:
+            submit(candidates)
+
+        results = []
+        for batch, future in classifying:
+            results.extend(zip(batch, await future))
+    return results
+
+
 # Categories are now loaded from Google Sheets via load_keywords_from_sheet()
 
 
@@ -614,6 +906,9 @@ def main():
         logging.error("Failed to load keywords. Exiting.")
         return
 
+    # Prompts are fetched once per run and shared by every OpenAI call
+    prompts = load_prompts_from_sheet()
+
     # Define the expected header
     expected_header = [
         "Date",
@@ -626,106 +921,86 @@ def main():
         "Extraction Timestamp",
     ]
 
+    # Read only the header row, the date column (to find the first free row)
+    # and the URL column (for duplicate checks) in one batchGet request
+    try:
+        header_range, date_range, url_range = worksheet.client.sheet.values_batch_get(
+            worksheet.spreadsheet.id,
+            [
+                f"'{worksheet.title}'!A1:H1",
+                f"'{worksheet.title}'!A2:A",
+                f"'{worksheet.title}'!F2:F",
+            ],
+        )
+    except Exception as e:
+        logging.error(f"Error reading Google Sheet: {e}")
+        return
+    header = header_range.get("values", [[]])[0]
+    dates = date_range.get("values", [])
+    urls = url_range.get("values", [])
+
     # Check if sheet has correct headers
-    existing_data = worksheet.get_all_values()
-    if not existing_data or existing_data[0] != expected_header:
+    if header != expected_header:
         # Clear the sheet and add correct headers
         worksheet.clear()
         worksheet.update_row(1, expected_header)
         logging.info("Added/Updated header to Google Sheet")
-        existing_data = [expected_header]  # Update existing_data to reflect new state
-    else:
-        # Get fresh data if headers were already correct
-        existing_data = worksheet.get_all_values()
+        dates, urls = [], []
 
-    # Get existing URLs to avoid duplicates
-    existing_urls = (
-        [row[5] for row in existing_data[1:]] if len(existing_data) > 1 else []
-    )
+    # Get existing URLs to avoid duplicates (empty cells come back as empty
+    # lists and are skipped)
+    existing_urls = {row[0] for row in urls if row}
+    next_row = len(dates) + 2
 
     results = []
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=2)
+    cutoff_str = cutoff_date.strftime("%Y-%m-%dT%H:%M:%S")
 
-    for category, keywords in categories.items():
-        for keyword in keywords:
-            logging.info(f"Searching: {keyword} in category {category}")
-            response = post_with_retry(
-                "https://web-api-cdn.ground.news/api/public/search/url",
-                HEADERS,
-                {"url": keyword},
-            )
-            if not response:
-                continue
-            try:
-                json_data = response.json()
-                for item in json_data.get("searchResults", []):
-                    if item.get("type") == "event":
-                        date_str = item.get("start", "")
-                        date = (
-                            datetime.fromisoformat(date_str.replace("Z", "")).replace(
-                                tzinfo=timezone.utc
-                            )
-                            if date_str
-                            else None
-                        )
-                        if not date or date < cutoff_date:
-                            continue
-                        slug = item.get("slug", "")
-                        headline, summary, article_url, source = extract_summary(slug)
-
-                        # Skip if URL already exists
-                        if article_url in existing_urls:
-                            logging.info(f"Skipping duplicate article: {article_url}")
-                            continue
-
-                        # Filter for US-based articles only
-                        if not is_us_based_article(headline, summary, source):
-                            logging.info(f"Skipping non-US article: {headline}")
-                            continue
-
-                        row_data = [
-                            date.date().isoformat(),
-                            category,
-                            keyword,
-                            headline,
-                            source,
-                            article_url,
-                            summary,
-                            datetime.now(timezone.utc).isoformat(),
-                        ]
-
-                        # Add to Google Sheet
-                        try:
-                            # Find the next empty row
-                            next_row = len(existing_data) + 1
-                            worksheet.update_row(next_row, row_data)
-                            logging.info(f"Added article to Google Sheet: {headline}")
-                            existing_urls.append(article_url)
-                            # Update existing_data to reflect the new row
-                            existing_data.append(row_data)
-                        except Exception as e:
-                            logging.error(f"Error adding to Google Sheet: {e}")
-
-                        # Also keep in local results
-                        results.append(
-                            {
-                                "Date": date.date(),
-                                "Category": category,
-                                "Keyword": keyword,
-                                "Headline": headline,
-                                "Source": source,
-                                "URL": article_url,
-                                "Summary": summary,
-                                "Extraction Timestamp": datetime.now(
-                                    timezone.utc
-                                ).isoformat(),
-                            }
-                        )
+    # Scrape all keywords concurrently, classifying articles as they arrive
+    classified = asyncio.run(
+        scrape_all(categories, cutoff_str, existing_urls, prompts)
+    )
 
-                        # Avoid rate limiting
-                        time.sleep(2)
-            except Exception as e:
-                logging.error(f"Error processing {keyword}: {e}")
+    # Buffer new rows and flush them to the sheet in SHEET_WRITE_BATCH_SIZE
+    # chunks, so a large run never sends one oversized request
+    pending_rows = []
+    for article, is_us in classified:
+        category, keyword, date, headline, summary, article_url, source = article
+        if not is_us:
+            logging.info(f"Skipping non-US article: {headline}")
+            continue
+
+        extracted_at = datetime.now(timezone.utc).isoformat()
+        row_data = [
+            date.date().isoformat(),
+            category,
+            keyword,
+            headline,
+            source,
+            article_url,
+            summary,
+            extracted_at,
+        ]
+        pending_rows.append(row_data)
+        if len(pending_rows) >= SHEET_WRITE_BATCH_SIZE:
+            next_row = flush_rows(worksheet, pending_rows, next_row)
+
+        # Also keep in local results
+        results.append(
+            {
+                "Date": date.date(),
+                "Category": category,
+                "Keyword": keyword,
+                "Headline": headline,
+                "Source": source,
+                "URL": article_url,
+                "Summary": summary,
+                "Extraction Timestamp": extracted_at,
+            }
+        )
+
+    if pending_rows:
+        flush_rows(worksheet, pending_rows, next_row)
 
     # Save local copy as CSV
     df = pd.DataFrame(results)
@@ -738,22 +1013,45 @@ def main():
     if len(df) > 0:
         logging.info("Generating explainer script and one-sheet...")
 
-        # Generate 60-second explainer script
-        script = generate_explainer_script(df)
-
-        # Generate one-sheet briefing
-        one_sheet = generate_one_sheet(df)
+        # Generate the 60-second explainer script and one-sheet briefing
+        # concurrently, since each is a separate OpenAI request
+        summaries_text = _build_summaries(df)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            script_future = executor.submit(
+                generate_explainer_script, df, prompts, summaries_text
+            )
+            one_sheet_future = executor.submit(
+                generate_one_sheet, df, prompts, summaries_text
+            )
+            script = script_future.result()
+            one_sheet = one_sheet_future.result()
 
         if script or one_sheet:
             # Get the main spreadsheet object for saving
             try:
-                client = get_google_client()
-                sheet = client.open("Maya News Extraction")
-
-                # Save 60-second explainer script
+                sheet = get_spreadsheet()
+
+                # Queue both outputs and write them in a single request
+                script_update = (
+                    prepare_daily_row_update(
+                        sheet, "Explainer Script", ["Date", "Explainer"], script
+                    )
+                    if script
+                    else None
+                )
+                one_sheet_update = (
+                    prepare_daily_row_update(
+                        sheet, "One Sheet", ["Date", "One Sheet Briefing"], one_sheet
+                    )
+                    if one_sheet
+                    else None
+                )
+                updates = [u for u in (script_update, one_sheet_update) if u]
+                success = bool(updates) and save_daily_outputs(sheet, updates)
+
+                # Report 60-second explainer script
                 if script:
-                    success = save_explainer_script(sheet, script)
-                    if success:
+                    if success and script_update:
                         logging.info("60-second explainer script generated and saved!")
                         print("\n" + "=" * 60)
                         print("GENERATED 60-SECOND EXPLAINER SCRIPT:")
@@ -763,10 +1061,9 @@ def main():
                     else:
                         logging.error("Failed to save explainer script")
 
-                # Save one-sheet briefing
+                # Report one-sheet briefing
                 if one_sheet:
-                    success = save_one_sheet(sheet, one_sheet)
-                    if success:
+                    if success and one_sheet_update:
                         logging.info("One-sheet briefing generated and saved!")
                         print("\n" + "=" * 60)
                         print("GENERATED ONE-SHEET BRIEFING:")
@@ -1,17 +1,21 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
+from bs4 import BeautifulSoup, SoupStrainer
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
-import time
-import json
+from functools import lru_cache
+import orjson
+import re
 import os
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
+    retry_if_exception,
     retry_if_exception_type,
 )
 
@@ -24,8 +28,9 @@ logging.basicConfig(
 
 
 # Google Sheets setup
-def init_gspread():
-    """Initialize Google Sheets client."""
+@lru_cache(maxsize=1)
+def _get_client():
+    """Authorize the gspread client once per process."""
     scope = [
         "https://spreadsheets.google.com/feeds",
         "https://www.googleapis.com/auth/drive",
@@ -33,45 +38,49 @@ def init_gspread():
     creds = ServiceAccountCredentials.from_json_keyfile_name(
         "/mnt/c/Users/hp/Desktop/Upwork/grounds/credentials.json", scope
     )
-    client = gspread.authorize(creds)
-    return client.open("Maya News Extraction").sheet1
+    return gspread.authorize(creds)
 
 
-def load_keywords_from_sheet():
-    """Load keywords and categories from Google Sheets."""
-    try:
-        scope = [
-            "https://spreadsheets.google.com/feeds",
-            "https://www.googleapis.com/auth/drive",
-        ]
-        creds = ServiceAccountCredentials.from_json_keyfile_name(
-            "/mnt/c/Users/hp/Desktop/Upwork/grounds/credentials.json", scope
-        )
-        client = gspread.authorize(creds)
-        spreadsheet = client.open("Maya News Extraction")
+def init_gspread():
+    """Initialize Google Sheets client and open the spreadsheet."""
+    return _get_client().open("Maya News Extraction")
 
-        try:
-            worksheet = spreadsheet.worksheet("Keywords")
-            # Get all data from the Keywords sheet
-            data = worksheet.get_all_records()
-
-            # Build categories dictionary from sheet data
-            categories = {}
-            for row in data:
-                if row.get("Active", "").upper() == "TRUE":
-                    category = row.get("Category", "")
-                    keyword = row.get("Keyword", "")
-                    if category and keyword:
-                        if category not in categories:
-                            categories[category] = []
-                        categories[category].append(keyword)
-
-            logging.info(f"Loaded {len(categories)} categories from Keywords sheet")
-            return categories
-
-        except gspread.WorksheetNotFound:
-            logging.warning("Keywords sheet not found, using fallback categories")
-            return get_fallback_keywords()
+
+# Keywords loaded once per process
+_cached_keywords = None
+
+
+def load_keywords_from_sheet(spreadsheet):
+    """Load keywords and categories from the already opened spreadsheet."""
+    global _cached_keywords
+
+    if _cached_keywords is not None:
+        logging.debug("Using cached keywords")
+        return _cached_keywords
+
+    try:
+        worksheet = spreadsheet.worksheet("Keywords")
+        # Get all data from the Keywords sheet
+        data = worksheet.get_all_records()
+
+        # Build categories dictionary from sheet data
+        categories = {}
+        for row in data:
+            if row.get("Active", "").upper() == "TRUE":
+                category = row.get("Category", "")
+                keyword = row.get("Keyword", "")
+                if category and keyword:
+                    if category not in categories:
+                        categories[category] = []
+                    categories[category].append(keyword)
+
+        logging.info(f"Loaded {len(categories)} categories from Keywords sheet")
+        _cached_keywords = categories
+        return categories
+
+    except gspread.WorksheetNotFound:
+        logging.warning("Keywords sheet not found, using fallback categories")
+        return get_fallback_keywords()
 
     except Exception as e:
         logging.error(f"Error loading keywords from sheet: {e}")
@@ -80,24 +89,10 @@ def load_keywords_from_sheet():
 
 def get_fallback_keywords():
     """Fallback keywords if Google Sheets is unavailable."""
-    return {
-        "Press & Information Freedom": [
-            "press freedom",
-            "journalist arrested",
-            "book ban",
-            "disinformation",
-        ],
-        "Voting Rights & Election Integrity": [
-            "voter suppression",
-            "gerrymandering",
-            "election interference",
-        ],
-        "Judicial & Legal Integrity": [
-            "court independence",
-            "due process",
-            "rule of law",
-        ],
-    }
+    # Same keywords the setup script writes to the Keywords sheet
+    from setup_keywords_sheet import CATEGORIES
+
+    return CATEGORIES
 
 
 # API headers
@@ -120,27 +115,62 @@ headers = {
 
 # Keywords are now loaded from Google Sheets via load_keywords_from_sheet()
 
+# Article pages fetched concurrently per keyword, and pooled keep-alive
+# connections shared by all ground.news requests
+MAX_CONCURRENT_PARSES = 10
+MAX_CONNECTIONS = 20
+
+# Token bucket for ground.news requests: waits only when the rate is exceeded
+MAX_REQUESTS_PER_SECOND = 10
+rate_limiter = AsyncLimiter(MAX_REQUESTS_PER_SECOND, 1)
+
+# Article pages are read up to this size to bound per-request memory
+MAX_ARTICLE_BYTES = 2 * 1024 * 1024
+
+# Only the tags parse_article reads headline, sources and summary from
+ARTICLE_STRAINER = SoupStrainer(["h1", "ul", "span", "div", "a", "p"])
+
+# Fallback source containers, matched during a single tree walk
+SOURCE_CLASSES = frozenset(
+    {
+        "source",
+        "publication",
+        "article-source",
+        "publisher",
+        "source-attribution",
+        "byline",
+        "source-container",
+        "publisher-name",
+        "source-name",
+        "source-link",
+        "primary-source",
+        "article-meta",
+    }
+)
+SOURCE_DOMAIN_RE = re.compile(
+    r"cnn\.com|reuters\.com|nytimes\.com|npr\.org|foxnews\.com", re.IGNORECASE
+)
+
 
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=5, max=20),
-    retry=retry_if_exception_type(requests.exceptions.HTTPError),
+    retry=retry_if_exception_type(aiohttp.ClientResponseError),
     after=lambda retry_state: logging.info(
-        f"Retrying request for '{retry_state.args[0]}' after {retry_state.next_action.sleep} seconds (attempt {retry_state.attempt_number})"
+        f"Retrying request for '{retry_state.args[1]}' after {retry_state.next_action.sleep} seconds (attempt {retry_state.attempt_number})"
     ),
 )
-def fetch_articles(keyword):
+async def fetch_articles(session, keyword):
     """Fetch articles from Ground.news API for a given keyword with retry logic."""
     try:
         json_data = {"url": keyword}
-        response = requests.post(
+        await rate_limiter.acquire()
+        async with session.post(
             "https://web-api-cdn.ground.news/api/public/search/url",
-            headers=headers,
             json=json_data,
-            timeout=10,
-        )
-        response.raise_for_status()
-        result = response.json()
+        ) as response:
+            response.raise_for_status()
+            result = await response.json(content_type=None)
         logging.info(f"API response for '{keyword}': {result}")
         if isinstance(result, dict) and "searchResults" in result:
             return result["searchResults"]
@@ -151,29 +181,41 @@ def fetch_articles(keyword):
                 f"Unexpected response format for '{keyword}': {type(result)}"
             )
             return []
-    except requests.HTTPError as e:
+    except aiohttp.ClientResponseError as e:
         logging.error(f"HTTP error fetching articles for keyword '{keyword}': {e}")
         raise
-    except requests.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        # ValueError covers a response body that is not valid JSON
         logging.error(f"Error fetching articles for keyword '{keyword}': {e}")
         return []
 
 
-def parse_article(slug):
+async def parse_article(session, slug):
     """Parse article page using BeautifulSoup to extract details."""
     if not slug:
         logging.warning("No slug provided for article parsing")
         return None
     try:
         params = {"_rsc": "19oxi"}
-        response = requests.get(
-            f"https://ground.news/article/{slug}",
-            params=params,
-            headers=headers,
-            timeout=10,
-        )
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        async with session.get(
+            f"https://ground.news/article/{slug}", params=params
+        ) as response:
+            response.raise_for_status()
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                body += chunk
+                if len(body) >= MAX_ARTICLE_BYTES:
+                    logging.warning(
+                        f"Article '{slug}' exceeds {MAX_ARTICLE_BYTES} bytes, truncating"
+                    )
+                    break
+            raw = bytes(body[:MAX_ARTICLE_BYTES])
+            try:
+                html = raw.decode(response.charset or "utf-8", errors="replace")
+            except LookupError:
+                # Unknown charset in the Content-Type header
+                html = raw.decode("utf-8", errors="replace")
+        soup = BeautifulSoup(html, "lxml", parse_only=ARTICLE_STRAINER)
 
         # Log a snippet of HTML for debugging
         logging.debug(f"HTML snippet for '{slug}': {str(soup)[:500]}...")
@@ -201,37 +243,23 @@ def parse_article(slug):
 
         # Fallback: Try other source containers or links
         if not sources:
-            source_elems = (
-                soup.find_all(class_="source")
-                or soup.find_all(class_="publication")
-                or soup.find_all(class_="article-source")
-                or soup.find_all(class_="publisher")
-                or soup.find_all(class_="source-attribution")
-                or soup.find_all(class_="byline")
-                or soup.find_all(class_="source-container")
-                or soup.find_all(class_="publisher-name")
-                or soup.find_all(class_="source-name")
-                or soup.find_all(class_="source-link")
-                or soup.find_all(class_="primary-source")
-                or soup.find_all(class_="article-meta")
-                or soup.find_all(
-                    "a",
-                    href=lambda x: x
-                    and any(
-                        domain in x.lower()
-                        for domain in [
-                            "cnn.com",
-                            "reuters.com",
-                            "nytimes.com",
-                            "npr.org",
-                            "foxnews.com",
-                        ]
-                    ),
-                )
-                or soup.find_all("span", class_=lambda x: x and "source" in x.lower())
-                or soup.find_all("div", class_=lambda x: x and "publisher" in x.lower())
-                or soup.find_all("span", class_=lambda x: x and "byline" in x.lower())
-            )
+            # Walk the tree once, sorting candidates into the fallback tiers;
+            # the first non-empty tier wins
+            class_matches, link_matches, substring_matches = [], [], []
+            for tag in soup.find_all(True):
+                classes = tag.get("class") or ()
+                if not SOURCE_CLASSES.isdisjoint(classes):
+                    class_matches.append(tag)
+                elif tag.name == "a" and SOURCE_DOMAIN_RE.search(tag.get("href", "")):
+                    link_matches.append(tag)
+                elif tag.name == "span":
+                    lowered = " ".join(classes).lower()
+                    if "source" in lowered or "byline" in lowered:
+                        substring_matches.append(tag)
+                elif tag.name == "div":
+                    if "publisher" in " ".join(classes).lower():
+                        substring_matches.append(tag)
+            source_elems = class_matches or link_matches or substring_matches
             for elem in source_elems:
                 source_text = elem.get_text(strip=True)
                 if source_text and source_text not in sources:
@@ -255,28 +283,19 @@ def parse_article(slug):
         else:
             # Log nearby elements and external links for debugging
             potential_source = (
-                soup.find("div", class_=lambda x: x and "source" in x.lower())
-                or soup.find("p", class_=lambda x: x and "source" in x.lower())
-                or soup.find("span", class_=lambda x: x and "publisher" in x.lower())
+                soup.select_one('div[class*="source" i]')
+                or soup.select_one('p[class*="source" i]')
+                or soup.select_one('span[class*="publisher" i]')
                 or soup.find(
                     "div",
                     class_="grid grid-cols-2 gap-y-[1rem] text-18 font-normal bg-tertiary-light dark:bg-dark-light p-[1rem]",
                 )
             )
-            external_links = soup.find_all(
-                "a",
-                href=lambda x: x
-                and any(
-                    domain in x.lower()
-                    for domain in [
-                        "cnn.com",
-                        "reuters.com",
-                        "nytimes.com",
-                        "npr.org",
-                        "foxnews.com",
-                    ]
-                ),
-            )
+            external_links = [
+                link
+                for link in soup.find_all("a", href=True)
+                if SOURCE_DOMAIN_RE.search(link["href"])
+            ]
             logging.warning(
                 f"No sources found for '{slug}'. Tried primary <div> and classes: source, publication, article-source, publisher, source-attribution, byline, source-container, publisher-name, source-name, source-link, primary-source, article-meta. Nearby elements: {str(potential_source)[:200] if potential_source else 'None'}. External links: {[link.get('href') for link in external_links][:5]}"
             )
@@ -306,7 +325,7 @@ def parse_article(slug):
                 summary_elem = (
                     soup.find("div", class_="article-summary")
                     or soup.find("p", class_="description")
-                    or soup.find("div", class_=lambda x: x and "summary" in x.lower())
+                    or soup.select_one('div[class*="summary" i]')
                 )
                 summary = (
                     summary_elem.get_text(strip=True)
@@ -323,28 +342,59 @@ def parse_article(slug):
         url = f"https://ground.news/article/{slug}"
 
         return {"headline": headline, "source": source, "url": url, "summary": summary}
-    except (requests.RequestException, AttributeError) as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError, AttributeError) as e:
         logging.error(f"Error parsing article '{slug}': {e}")
         return None
 
 
-def is_recent_article(article_date, days=30):
-    """Check if article is within the last N days."""
+def is_recent_article(article_date, cutoff):
+    """Check if article was published at or after the cutoff datetime."""
     if not article_date:
         logging.info("No date provided, treating as recent")
         return True
     try:
         article_datetime = datetime.fromisoformat(article_date.replace("Z", "+00:00"))
-        return article_datetime >= datetime.now().astimezone() - timedelta(days=days)
+        return article_datetime >= cutoff
     except ValueError:
         logging.warning(f"Invalid date format: {article_date}, treating as non-recent")
         return False
 
 
-def process_keyword(category, keyword, sheet):
-    """Process a single keyword, fetch articles, and write to Google Sheet."""
+def _is_quota_error(exc):
+    """True for Sheets API errors worth retrying (rate limits, outages)."""
+    return isinstance(exc, gspread.exceptions.APIError) and (
+        exc.response.status_code in (429, 500, 503)
+    )
+
+
+@retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, min=5, max=60),
+    retry=retry_if_exception(_is_quota_error),
+    reraise=True,
+)
+def append_rows_with_retry(sheet, rows):
+    """Append rows to the sheet, backing off only when Sheets pushes back."""
+    sheet.append_rows(rows, value_input_option="RAW")
+
+
+async def bounded_parse(sem, session, slug):
+    """Parse one article while holding a slot of the concurrency semaphore."""
+    async with sem, rate_limiter:
+        return await parse_article(session, slug)
+
+
+async def process_keyword(
+    category, keyword, sheet, existing_urls, session, sem, cutoff, extracted_at
+):
+    """Process a single keyword, fetch articles, and write to Google Sheet.
+
+    existing_urls is the set of URLs already in the sheet; it is updated as
+    rows are appended. Article pages are fetched concurrently under sem.
+    cutoff and extracted_at are computed once per run by main().
+    """
     logging.info(f"Processing keyword: {keyword} (Category: {category})")
-    articles = fetch_articles(keyword)
+    articles = await fetch_articles(session, keyword)
     skipped_articles = []
 
     if not isinstance(articles, list):
@@ -356,6 +406,12 @@ def process_keyword(category, keyword, sheet):
     # Create skipped_articles folder if it doesn't exist
     os.makedirs("skipped_articles", exist_ok=True)
 
+    # Rows are buffered and appended in one request after the article loop
+    buffered_rows = []
+    buffered_titles = []
+
+    candidates = []
+    candidate_urls = set()
     for article in articles:
         if not isinstance(article, dict):
             logging.warning(
@@ -367,7 +423,7 @@ def process_keyword(category, keyword, sheet):
             continue
 
         if article.get("type") != "event" or not is_recent_article(
-            article.get("start", "")
+            article.get("start", ""), cutoff
         ):
             logging.info(
                 f"Skipping article: {article.get('title', 'N/A')} (type: {article.get('type', 'N/A')}, date: {article.get('start', 'N/A')})"
@@ -383,7 +439,30 @@ def process_keyword(category, keyword, sheet):
             )
             continue
 
-        article_data = parse_article(article.get("slug"))
+        # The article URL follows from the slug, so articles already in the
+        # sheet, or listed twice in this search, are skipped before their
+        # page is fetched and parsed
+        candidate_url = f"https://ground.news/article/{article.get('slug')}"
+        if candidate_url in existing_urls or candidate_url in candidate_urls:
+            logging.info(f"Skipping duplicate article: {candidate_url}")
+            skipped_articles.append(
+                {
+                    "keyword": keyword,
+                    "title": article.get("title", "N/A"),
+                    "reason": "Duplicate URL",
+                }
+            )
+            continue
+
+        candidate_urls.add(candidate_url)
+        candidates.append(article)
+
+    # Fetch and parse the remaining articles concurrently
+    parsed = await asyncio.gather(
+        *[bounded_parse(sem, session, article.get("slug")) for article in candidates]
+    )
+
+    for article, article_data in zip(candidates, parsed):
         if not article_data:
             skipped_articles.append(
                 {
@@ -402,10 +481,9 @@ def process_keyword(category, keyword, sheet):
             article_data["source"],
             article_data["url"],
             article_data["summary"],
-            datetime.now().astimezone().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            extracted_at,
         ]
 
-        existing_urls = [row[5] for row in sheet.get_all_values()[1:]]
         if article_data["url"] in existing_urls:
             logging.info(f"Skipping duplicate article: {article_data['url']}")
             skipped_articles.append(
@@ -417,47 +495,93 @@ def process_keyword(category, keyword, sheet):
             )
             continue
 
+        buffered_rows.append(row)
+        buffered_titles.append(article.get("title", "N/A"))
+        existing_urls.add(article_data["url"])
+
+    if buffered_rows:
         try:
-            sheet.append_row(row)
+            # Blocking gspread call (and its backoff) runs off the event loop
+            await asyncio.to_thread(append_rows_with_retry, sheet, buffered_rows)
             logging.info(
-                f"Successfully added article to sheet: {article_data['headline']}"
+                f"Successfully added {len(buffered_rows)} articles to sheet for '{keyword}'"
             )
         except gspread.exceptions.APIError as e:
             logging.error(f"Error writing to Google Sheet: {e}")
-            skipped_articles.append(
-                {
-                    "keyword": keyword,
-                    "title": article.get("title", "N/A"),
-                    "reason": f"Sheet write error: {e}",
-                }
-            )
-            continue
-
-        time.sleep(5)  # Increased delay to avoid rate limits
+            for row, title in zip(buffered_rows, buffered_titles):
+                existing_urls.discard(row[5])
+                skipped_articles.append(
+                    {
+                        "keyword": keyword,
+                        "title": title,
+                        "reason": f"Sheet write error: {e}",
+                    }
+                )
 
     if skipped_articles:
-        # Save to skipped_articles folder
+        # Append to the keyword's JSON Lines log in skipped_articles folder
         skipped_file = os.path.join(
-            "skipped_articles", f"skipped_articles_{keyword}.json"
+            "skipped_articles", f"skipped_articles_{keyword}.jsonl"
         )
-        with open(skipped_file, "w") as f:
-            json.dump(skipped_articles, f, indent=2)
+        with open(skipped_file, "ab") as f:
+            f.writelines(orjson.dumps(entry) + b"\n" for entry in skipped_articles)
         logging.info(
             f"Saved {len(skipped_articles)} skipped articles for '{keyword}' to {skipped_file}"
         )
 
 
+async def scrape(sheet, keywords_by_category, existing_urls, cutoff, extracted_at):
+    """Process every keyword concurrently over one shared aiohttp session."""
+    sem = asyncio.Semaphore(MAX_CONCURRENT_PARSES)
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS, ttl_dns_cache=300, keepalive_timeout=60
+        ),
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=15),
+    ) as session:
+        jobs = [
+            (category, keyword)
+            for category, keywords in keywords_by_category.items()
+            for keyword in keywords
+        ]
+        # A failing keyword is logged without cancelling the others
+        results = await asyncio.gather(
+            *[
+                process_keyword(
+                    category,
+                    keyword,
+                    sheet,
+                    existing_urls,
+                    session,
+                    sem,
+                    cutoff,
+                    extracted_at,
+                )
+                for category, keyword in jobs
+            ],
+            return_exceptions=True,
+        )
+        for (category, keyword), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                logging.error(
+                    f"Error processing keyword '{keyword}' in {category}: {result}"
+                )
+
+
 def main():
     """Main function to process all keywords and write to Google Sheet."""
-    sheet = init_gspread()
+    spreadsheet = init_gspread()
+    sheet = spreadsheet.sheet1
 
     # Load keywords from Google Sheets
-    keywords_by_category = load_keywords_from_sheet()
+    keywords_by_category = load_keywords_from_sheet(spreadsheet)
     if not keywords_by_category:
         logging.error("Failed to load keywords. Exiting.")
         return
 
-    if not sheet.get_all_values():
+    all_rows = sheet.get_all_values()
+    if not all_rows:
         header = [
             "Date",
             "Category",
@@ -468,16 +592,24 @@ def main():
             "Summary",
             "Extraction Timestamp",
         ]
-        sheet.append_row(header)
+        sheet.update("A1", [header])
         logging.info("Added header to Google Sheet")
 
-    for category, keywords in keywords_by_category.items():
-        for keyword in keywords:
-            process_keyword(category, keyword, sheet)
-            time.sleep(5)  # Increased delay to avoid rate limits
+    # Read existing URLs once; process_keyword keeps the set up to date
+    existing_urls = {row[5] for row in all_rows[1:] if len(row) > 5}
+
+    # Recency cutoff and extraction timestamp are shared by every article
+    now = datetime.now().astimezone()
+    cutoff = now - timedelta(days=30)
+    extracted_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    asyncio.run(
+        scrape(sheet, keywords_by_category, existing_urls, cutoff, extracted_at)
+    )
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    df = pd.DataFrame(sheet.get_all_values()[1:], columns=sheet.get_all_values()[0])
+    values = sheet.get_all_values()
+    df = pd.DataFrame(values[1:], columns=values[0])
     df.to_csv(f"news_extraction_{timestamp}.csv", index=False)
     logging.info(f"Exported results to news_extraction_{timestamp}.csv")
 
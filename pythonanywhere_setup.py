@@ -14,9 +14,15 @@ Usage:
 """
 
 import os
+import shutil
 import sys
 from datetime import datetime
 
+# Runner script shipped with the repo and copied into place by setup
+RUNNER_TEMPLATE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'templates', 'run_daily_scraper.py'
+)
+
 def create_env_template():
     """Create a template .env file for environment variables."""
     env_template = """# Environment variables for Maya News Scraper
@@ -38,60 +44,8 @@ TZ=UTC
         print("✅ .env file already exists")
 
 def create_runner_script():
-    """Create a runner script that loads environment variables."""
-    runner_script = """#!/usr/bin/env python3
-
-import os
-import sys
-import logging
-from datetime import datetime
-
-# Add current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-# Load environment variables from .env file
-def load_env():
-    env_file = os.path.join(os.path.dirname(__file__), '.env')
-    if os.path.exists(env_file):
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
-
-# Load environment variables
-load_env()
-
-# Configure logging for PythonAnywhere
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(f"maya_scraper_{datetime.now().strftime('%Y%m%d')}.log"),
-        logging.StreamHandler()
-    ]
-)
-
-def main():
-    try:
-        # Import and run the main scraper
-        from ground_news_scraper import main as scraper_main
-        
-        logging.info("Starting Maya News Scraper on PythonAnywhere")
-        scraper_main()
-        logging.info("Maya News Scraper completed successfully")
-        
-    except Exception as e:
-        logging.error(f"Error running Maya News Scraper: {e}")
-        sys.exit(1)
-
-if __name__ == "__main__":
-    main()
-"""
-    
-    with open('run_daily_scraper.py', 'w') as f:
-        f.write(runner_script)
+    """Copy the runner script, which loads environment variables, into place."""
+    shutil.copyfile(RUNNER_TEMPLATE, 'run_daily_scraper.py')
     
     # Make it executable
     os.chmod('run_daily_scraper.py', 0o755)
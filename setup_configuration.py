@@ -7,42 +7,67 @@ in Google Sheets for the Maya News Extraction system.
 
 import sys
 import logging
-from setup_keywords_sheet import setup_keywords_sheet
-from setup_prompts_sheet import setup_prompts_sheet
+from sheets_client import batch_update_values, get_sheet
+from setup_keywords_sheet import prepare_keywords_sheet
+from setup_prompts_sheet import prepare_prompts_sheet
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+logger = logging.getLogger(__name__)
 
 def main():
     """Run both setup scripts to initialize the configuration system."""
-    print("🚀 Setting up Maya News Extraction Configuration System")
-    print("=" * 60)
+    logger.info("🚀 Setting up Maya News Extraction Configuration System")
+    logger.info("=" * 60)
     
     success_count = 0
     total_setups = 2
-    
-    # Setup Keywords sheet
-    print("\n📋 Setting up Keywords sheet...")
-    try:
-        setup_keywords_sheet()
-        print("✅ Keywords sheet setup completed successfully")
-        success_count += 1
-    except Exception as e:
-        print(f"❌ Keywords sheet setup failed: {e}")
-        logging.error(f"Keywords sheet setup error: {e}")
-    
-    # Setup Prompts sheet
-    print("\n💬 Setting up Prompts sheet...")
+    updates = []
+
+    # Authorize once and open the spreadsheet shared by both setups
     try:
-        setup_prompts_sheet()
-        print("✅ Prompts sheet setup completed successfully")
-        success_count += 1
+        sheet = get_sheet()
     except Exception as e:
-        print(f"❌ Prompts sheet setup failed: {e}")
-        logging.error(f"Prompts sheet setup error: {e}")
+        logger.error(f"❌ Could not open the spreadsheet: {e}")
+        sheet = None
+
+    # Prepare Keywords sheet
+    logger.info("\n📋 Setting up Keywords sheet...")
+    if sheet is not None:
+        try:
+            update = prepare_keywords_sheet(sheet)
+            if update is None:
+                # Already up to date, nothing to write
+                success_count += 1
+            else:
+                updates.append(update)
+        except Exception as e:
+            logger.error(f"❌ Keywords sheet setup failed: {e}")
+
+    # Prepare Prompts sheet
+    logger.info("\n💬 Setting up Prompts sheet...")
+    if sheet is not None:
+        try:
+            update = prepare_prompts_sheet(sheet)
+            if update is None:
+                # Already up to date, nothing to write
+                success_count += 1
+            else:
+                updates.append(update)
+        except Exception as e:
+            logger.error(f"❌ Prompts sheet setup failed: {e}")
+
+    # Populate both sheets together, one values.batchUpdate per 5000 rows
+    if updates:
+        try:
+            batch_update_values(sheet, updates)
+            for update in updates:
+                sheet_name = update["range"].split("!")[0].strip("'")
+                logger.info(
+                    f"✅ {sheet_name} sheet populated with "
+                    f"{len(update['values']) - 1} entries"
+                )
+            success_count += len(updates)
+        except Exception as e:
+            logger.error(f"❌ Writing configuration sheets failed: {e}")
     
     # Summary
     print("\n" + "=" * 60)
@@ -69,4 +94,6 @@ def main():
         return 1
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     sys.exit(main())
@@ -1,154 +1,192 @@
 #!/usr/bin/env python3
 
+import logging
 import pygsheets
+from sheets_client import batch_update_values, get_sheet, with_backoff
+
+__all__ = ["CATEGORIES", "prepare_keywords_sheet", "setup_keywords_sheet"]
+
+logger = logging.getLogger(__name__)
+
+
+# Current categories and keywords
+CATEGORIES = {
+    "Press & Information Freedom": [
+        "press freedom",
+        "journalist arrested",
+        "book ban",
+        "curriculum ban",
+        "library censorship",
+        "disinformation",
+        "media blackout",
+        "anti-CRT",
+        "newsroom raid",
+    ],
+    "Judicial & Legal Integrity": [
+        "court independence",
+        "due process",
+        "habeas corpus",
+        "rule of law",
+        "judge removal",
+        "legal overhaul",
+        "military tribunal",
+        "unconstitutional",
+    ],
+    "Voting Rights & Election Integrity": [
+        "voter suppression",
+        "gerrymandering",
+        "election interference",
+        "ballot access",
+        "poll closures",
+        "voter ID laws",
+        "disinformation campaign",
+        "electoral fraud claims",
+    ],
+    "Checks, Balances & Rule of Law": [
+        "executive overreach",
+        "constitutional crisis",
+        "legislative bypass",
+        "SCOTUS ignored",
+        "emergency powers",
+        "separation of powers",
+    ],
+    "Institutional Capture": [
+        "DOJ politicization",
+        "education department purge",
+        "NSC shake-up",
+        "civil service loyalty oath",
+        "deep state",
+        "Trump loyalists installed",
+    ],
+    "Civic Resistance & Whistleblowing": [
+        "protest crackdown",
+        "whistleblower",
+        "civil disobedience",
+        "lawsuit filed",
+        "watchdog report",
+        "leaked memo",
+        "activist arrested",
+    ],
+    "Economic Power & Authoritarianism": [
+        "union busting",
+        "labor strike suppressed",
+        "corporate lobbying",
+        "anti-worker law",
+        "economic coercion",
+        "monopoly power",
+    ],
+    "Immigration, Policing & Detention": [
+        "mass detention",
+        "ICE raid",
+        "border wall",
+        "family separation",
+        "surveillance program",
+        "immigrant abuse",
+        "asylum denied",
+    ],
+    "Surveillance & Tech Manipulation": [
+        "facial recognition",
+        "app ban",
+        "AI censorship",
+        "algorithmic bias",
+        "digital surveillance",
+        "metadata collection",
+        "social media manipulation",
+    ],
+    "Cultural Control & Civil Rights Erosion": [
+        "anti-LGBTQ+ law",
+        "drag ban",
+        "bathroom bill",
+        "book removal",
+        "censorship law",
+        "identity policing",
+        "anti-DEI",
+        "religious exemption law",
+    ],
+    "Global Authoritarian Networks": [
+        "Orbán",
+        "Netanyahu",
+        "Modi",
+        "Erdogan",
+        "global authoritarianism",
+        "democracy backsliding",
+        "transnational repression",
+        "illiberal democracy",
+    ],
+}
+
+
+def prepare_keywords_sheet(sheet):
+    """Get or create, clear and size the Keywords sheet.
+
+    Returns the ValueRange dict that populates it, so callers can batch it
+    with other sheets in one values.batchUpdate request.
+    Returns None when the sheet already holds the data, so nothing is written.
+    """
+    # Convert to list format for Google Sheets
+    categories_data = [["Category", "Keyword", "Active"]] + [
+        [category, keyword, "TRUE"]
+        for category, keywords in CATEGORIES.items()
+        for keyword in keywords
+    ]
+
+    # Try to get existing Keywords sheet or create new one
+    try:
+        worksheet = with_backoff(lambda: sheet.worksheet_by_title("Keywords"))
+        # Leave the sheet alone when it already holds exactly this data
+        existing = with_backoff(
+            lambda: worksheet.get_all_values(
+                include_tailing_empty=False, include_tailing_empty_rows=False
+            )
+        )
+        if existing == categories_data:
+            logger.info("'Keywords' worksheet is already up to date - skipping")
+            return None
+        logger.info("Found existing 'Keywords' worksheet - will update")
+        # Clear existing content
+        with_backoff(worksheet.clear)
+    except pygsheets.WorksheetNotFound:
+        worksheet = with_backoff(lambda: sheet.add_worksheet("Keywords"))
+        logger.info("Created new 'Keywords' worksheet")
+
+    # Size the grid to exactly fit the data
+    with_backoff(
+        lambda: worksheet.resize(
+            rows=len(categories_data), cols=len(categories_data[0])
+        )
+    )
+    end_col = chr(ord("A") + len(categories_data[0]) - 1)
+    return {
+        "range": f"'Keywords'!A1:{end_col}{len(categories_data)}",
+        "values": categories_data,
+    }
 
 
 def setup_keywords_sheet():
     """Create and populate the Keywords sheet with current categories."""
     try:
-        # Authorize with service account credentials
-        client = pygsheets.authorize(service_file="credentials.json")
-        # Open the spreadsheet by name
-        sheet = client.open("Maya News Extraction")
-
-        # Try to get existing Keywords sheet or create new one
-        try:
-            worksheet = sheet.worksheet_by_title("Keywords")
-            print("Found existing 'Keywords' worksheet - will update")
-            # Clear existing content
-            worksheet.clear()
-        except pygsheets.WorksheetNotFound:
-            worksheet = sheet.add_worksheet("Keywords", rows=200, cols=10)
-            print("Created new 'Keywords' worksheet")
-
-        # Define current categories and keywords
-        CATEGORIES = {
-            "Press & Information Freedom": [
-                "press freedom",
-                "journalist arrested",
-                "book ban",
-                "curriculum ban",
-                "library censorship",
-                "disinformation",
-                "media blackout",
-                "anti-CRT",
-                "newsroom raid",
-            ],
-            "Judicial & Legal Integrity": [
-                "court independence",
-                "due process",
-                "habeas corpus",
-                "rule of law",
-                "judge removal",
-                "legal overhaul",
-                "military tribunal",
-                "unconstitutional",
-            ],
-            "Voting Rights & Election Integrity": [
-                "voter suppression",
-                "gerrymandering",
-                "election interference",
-                "ballot access",
-                "poll closures",
-                "voter ID laws",
-                "disinformation campaign",
-                "electoral fraud claims",
-            ],
-            "Checks, Balances & Rule of Law": [
-                "executive overreach",
-                "constitutional crisis",
-                "legislative bypass",
-                "SCOTUS ignored",
-                "emergency powers",
-                "separation of powers",
-            ],
-            "Institutional Capture": [
-                "DOJ politicization",
-                "education department purge",
-                "NSC shake-up",
-                "civil service loyalty oath",
-                "deep state",
-                "Trump loyalists installed",
-            ],
-            "Civic Resistance & Whistleblowing": [
-                "protest crackdown",
-                "whistleblower",
-                "civil disobedience",
-                "lawsuit filed",
-                "watchdog report",
-                "leaked memo",
-                "activist arrested",
-            ],
-            "Economic Power & Authoritarianism": [
-                "union busting",
-                "labor strike suppressed",
-                "corporate lobbying",
-                "anti-worker law",
-                "economic coercion",
-                "monopoly power",
-            ],
-            "Immigration, Policing & Detention": [
-                "mass detention",
-                "ICE raid",
-                "border wall",
-                "family separation",
-                "surveillance program",
-                "immigrant abuse",
-                "asylum denied",
-            ],
-            "Surveillance & Tech Manipulation": [
-                "facial recognition",
-                "app ban",
-                "AI censorship",
-                "algorithmic bias",
-                "digital surveillance",
-                "metadata collection",
-                "social media manipulation",
-            ],
-            "Cultural Control & Civil Rights Erosion": [
-                "anti-LGBTQ+ law",
-                "drag ban",
-                "bathroom bill",
-                "book removal",
-                "censorship law",
-                "identity policing",
-                "anti-DEI",
-                "religious exemption law",
-            ],
-            "Global Authoritarian Networks": [
-                "Orbán",
-                "Netanyahu",
-                "Modi",
-                "Erdogan",
-                "global authoritarianism",
-                "democracy backsliding",
-                "transnational repression",
-                "illiberal democracy",
-            ],
-        }
-
-        # Convert to list format for Google Sheets
-        categories_data = [["Category", "Keyword", "Active"]]
-
-        for category, keywords in CATEGORIES.items():
-            for keyword in keywords:
-                categories_data.append([category, keyword, "TRUE"])
-
-        # Add all data to the sheet
-        for i, row in enumerate(categories_data):
-            worksheet.update_row(i + 1, row)
-
-        keyword_count = len(categories_data) - 1
-        print(f"Keywords sheet populated with {keyword_count} entries")
-        print("\nInstructions for use:")
-        print("- Column A: Category name")
-        print("- Column B: Keyword to search for")
-        print("- Column C: Active (TRUE/FALSE) - set to FALSE to disable")
-        print("\nYou can now easily modify keywords directly in Google Sheet!")
+        # Open the spreadsheet with the shared, cached client
+        sheet = get_sheet()
+
+        update = prepare_keywords_sheet(sheet)
+        if update is None:
+            return
+
+        # Add all data to the sheet, one request per 5000 rows
+        batch_update_values(sheet, [update])
+
+        keyword_count = len(update["values"]) - 1
+        logger.info(f"Keywords sheet populated with {keyword_count} entries")
+        logger.info("\nInstructions for use:")
+        logger.info("- Column A: Category name")
+        logger.info("- Column B: Keyword to search for")
+        logger.info("- Column C: Active (TRUE/FALSE) - set to FALSE to disable")
+        logger.info("\nYou can now easily modify keywords directly in Google Sheet!")
 
     except Exception as e:
-        print(f"Error setting up Keywords sheet: {e}")
+        logger.error(f"Error setting up Keywords sheet: {e}")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     setup_keywords_sheet()
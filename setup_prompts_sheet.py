@@ -1,32 +1,20 @@
 #!/usr/bin/env python3
 
+import logging
 import pygsheets
+from sheets_client import batch_update_values, get_sheet, with_backoff
 
+__all__ = ["PROMPTS_DATA", "prepare_prompts_sheet", "setup_prompts_sheet"]
 
-def setup_prompts_sheet():
-    """Create and populate the Prompts sheet with OpenAI prompts."""
-    try:
-        # Authorize with service account credentials
-        client = pygsheets.authorize(service_file="credentials.json")
-        # Open the spreadsheet by name
-        sheet = client.open("Maya News Extraction")
-        
-        # Try to get existing Prompts sheet or create new one
-        try:
-            worksheet = sheet.worksheet_by_title("Prompts")
-            print("Found existing 'Prompts' worksheet - will update")
-            # Clear existing content
-            worksheet.clear()
-        except pygsheets.WorksheetNotFound:
-            worksheet = sheet.add_worksheet("Prompts", rows=50, cols=10)
-            print("Created new 'Prompts' worksheet")
-        
-        # Define the prompts used in the system
-        prompts_data = [
-            ["Prompt Name", "Prompt Text", "Active"],
-            [
-                "Explainer Script",
-                """You are a U.S.-based political journalist creating a 60-second daily briefing for an audience deeply concerned with American democracy.
+logger = logging.getLogger(__name__)
+
+
+# Prompts used in the system, header row first
+PROMPTS_DATA = [
+    ["Prompt Name", "Prompt Text", "Active"],
+    [
+        "Explainer Script",
+        """You are a U.S.-based political journalist creating a 60-second daily briefing for an audience deeply concerned with American democracy.
 
 Use the following spreadsheet of today's U.S. news stories to identify and summarize the items with the biggest impact on democracy—this includes developments related to voting rights, elections, disinformation, political extremism, civil liberties, court decisions, legislation, government transparency, and the rule of law.
 
@@ -46,11 +34,11 @@ Spreadsheet input:
 {summaries_text}
 
 Write your 60-second democracy briefing (approximately 150-160 words):""",
-                "TRUE"
-            ],
-            [
-                "One Sheet Briefing",
-                """Acting as a news producer for a political update show, please use the spreadsheet to create a one-sheet of the news that is most critical to preserving US democracy.
+        "TRUE"
+    ],
+    [
+        "One Sheet Briefing",
+        """Acting as a news producer for a political update show, please use the spreadsheet to create a one-sheet of the news that is most critical to preserving US democracy.
 
 Your task: Create a comprehensive one-sheet briefing document that covers the most critical democracy-related news from today's stories.
 
@@ -67,20 +55,18 @@ Spreadsheet input:
 {summaries_text}
 
 Create your comprehensive one-sheet briefing:""",
-                "TRUE"
-            ],
-            [
-                "US Article Filter",
-                """Determine if this news article is about United States domestic news or politics.
+        "TRUE"
+    ],
+    [
+        "US Article Filter Batch",
+        """For each numbered news article below, determine if it is about United States domestic news or politics.
 
-Article details:
-Headline: {headline}
-Summary: {summary}
-Source: {source}
+Articles:
+{articles_text}
 
 Instructions:
-- Return "YES" if this article is primarily about US domestic news, politics, government, elections, civil rights, or other US-specific issues
-- Return "NO" if this article is about international news, foreign countries, or global issues that don't directly impact US domestic affairs
+- Answer "YES" if an article is primarily about US domestic news, politics, government, elections, civil rights, or other US-specific issues
+- Answer "NO" if an article is about international news, foreign countries, or global issues that don't directly impact US domestic affairs
 - Focus on whether the story has direct relevance to American democracy, US politics, or US domestic policy
 
 Examples:
@@ -90,26 +76,76 @@ Examples:
 - International trade deal → NO (unless it specifically impacts US domestic policy)
 - US military action abroad → NO (unless it impacts domestic politics)
 
-Response (just YES or NO):""",
-                "TRUE"
-            ]
-        ]
-        
-        # Add all data to the sheet
-        for i, row in enumerate(prompts_data):
-            worksheet.update_row(i + 1, row)
-        
-        prompt_count = len(prompts_data) - 1
-        print(f"Prompts sheet populated with {prompt_count} prompts")
-        print("\nInstructions for use:")
-        print("- Column A: Prompt name/identifier")
-        print("- Column B: Full prompt text")
-        print("- Column C: Active (TRUE/FALSE) - set to FALSE to disable")
-        print("\nYou can now modify prompts directly in Google Sheet!")
+Respond with a JSON object of the form {{"results": ["YES", "NO", ...]}} containing one entry per article, in order:""",
+        "TRUE"
+    ]
+]
+
+
+def prepare_prompts_sheet(sheet):
+    """Get or create, clear and size the Prompts sheet.
+
+    Returns the ValueRange dict that populates it, so callers can batch it
+    with other sheets in one values.batchUpdate request.
+    Returns None when the sheet already holds the data, so nothing is written.
+    """
+    # Try to get existing Prompts sheet or create new one
+    try:
+        worksheet = with_backoff(lambda: sheet.worksheet_by_title("Prompts"))
+        # Leave the sheet alone when it already holds exactly this data
+        existing = with_backoff(
+            lambda: worksheet.get_all_values(
+                include_tailing_empty=False, include_tailing_empty_rows=False
+            )
+        )
+        if existing == PROMPTS_DATA:
+            logger.info("'Prompts' worksheet is already up to date - skipping")
+            return None
+        logger.info("Found existing 'Prompts' worksheet - will update")
+        # Clear existing content
+        with_backoff(worksheet.clear)
+    except pygsheets.WorksheetNotFound:
+        worksheet = with_backoff(lambda: sheet.add_worksheet("Prompts"))
+        logger.info("Created new 'Prompts' worksheet")
+
+    # Size the grid to exactly fit the data
+    with_backoff(
+        lambda: worksheet.resize(
+            rows=len(PROMPTS_DATA), cols=len(PROMPTS_DATA[0])
+        )
+    )
+    end_col = chr(ord("A") + len(PROMPTS_DATA[0]) - 1)
+    return {
+        "range": f"'Prompts'!A1:{end_col}{len(PROMPTS_DATA)}",
+        "values": PROMPTS_DATA,
+    }
+
+
+def setup_prompts_sheet():
+    """Create and populate the Prompts sheet with OpenAI prompts."""
+    try:
+        # Open the spreadsheet with the shared, cached client
+        sheet = get_sheet()
+
+        update = prepare_prompts_sheet(sheet)
+        if update is None:
+            return
+
+        # Add all data to the sheet, one request per 5000 rows
+        batch_update_values(sheet, [update])
+
+        prompt_count = len(update["values"]) - 1
+        logger.info(f"Prompts sheet populated with {prompt_count} prompts")
+        logger.info("\nInstructions for use:")
+        logger.info("- Column A: Prompt name/identifier")
+        logger.info("- Column B: Full prompt text")
+        logger.info("- Column C: Active (TRUE/FALSE) - set to FALSE to disable")
+        logger.info("\nYou can now modify prompts directly in Google Sheet!")
         
     except Exception as e:
-        print(f"Error setting up Prompts sheet: {e}")
+        logger.error(f"Error setting up Prompts sheet: {e}")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     setup_prompts_sheet()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+"""
+Shared Google Sheets client for the Maya News Extraction scripts.
+The authorized client and opened spreadsheet are cached so every caller
+in a process reuses the same OAuth token, HTTP session and sheet handle.
+"""
+
+import functools
+import re
+from pathlib import Path
+
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
+
+# Service account key, resolved once against the directory the script runs from
+CREDENTIALS_FILE = str(Path("credentials.json").resolve())
+
+# Most rows sent in one values.batchUpdate, well under the request size limit
+WRITE_CHUNK_ROWS = 5000
+
+A1_RANGE_RE = re.compile(r"([A-Z]+)(\d+):([A-Z]+)\d+")
+
+
+def _is_retryable(exc):
+    """True for Sheets API errors worth retrying (rate limits, outages)."""
+    from googleapiclient.errors import HttpError
+
+    return isinstance(exc, HttpError) and exc.resp.status in (429, 500, 503)
+
+
+def with_backoff(fn, max_retries=6):
+    """Call fn(), backing off 1s, 2s, 4s... up to 32s when Sheets pushes back."""
+    return retry(
+        stop=stop_after_attempt(max_retries),
+        wait=wait_exponential(multiplier=1, max=32),
+        retry=retry_if_exception(_is_retryable),
+        reraise=True,
+    )(fn)()
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Return the authorized pygsheets client, authorizing on first use."""
+    import pygsheets
+
+    return pygsheets.authorize(service_file=CREDENTIALS_FILE)
+
+
+@functools.lru_cache(maxsize=1)
+def get_sheet():
+    """Open the Maya News Extraction spreadsheet once with the shared client."""
+    return with_backoff(lambda: get_client().open("Maya News Extraction"))
+
+
+def _split_value_range(update, chunk_rows):
+    """Split a 'Sheet'!A1:C9 ValueRange into ranges of at most chunk_rows rows."""
+    title, cells = update["range"].rsplit("!", 1)
+    start_col, start_row, end_col = A1_RANGE_RE.fullmatch(cells).groups()
+    start_row = int(start_row)
+    values = update["values"]
+    for offset in range(0, len(values), chunk_rows):
+        chunk = values[offset : offset + chunk_rows]
+        first = start_row + offset
+        yield {
+            "range": f"{title}!{start_col}{first}:{end_col}{first + len(chunk) - 1}",
+            "values": chunk,
+        }
+
+
+def batch_update_values(sheet, updates, chunk_rows=WRITE_CHUNK_ROWS):
+    """Write ValueRange dicts with values.batchUpdate, chunk_rows rows per request.
+
+    Small payloads still go out as a single request; large ones are split so
+    no request approaches the Sheets API size limit.
+    """
+    batch, batch_rows = [], 0
+    for update in updates:
+        for value_range in _split_value_range(update, chunk_rows):
+            if batch and batch_rows + len(value_range["values"]) > chunk_rows:
+                with_backoff(
+                    lambda: sheet.client.sheet.values_batch_update(
+                        sheet.id, {"data": batch}
+                    )
+                )
+                batch, batch_rows = [], 0
+            batch.append(value_range)
+            batch_rows += len(value_range["values"])
+    if batch:
+        with_backoff(
+            lambda: sheet.client.sheet.values_batch_update(sheet.id, {"data": batch})
+        )
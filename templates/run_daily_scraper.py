@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import logging
+from datetime import datetime
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env'), override=True
+)
+
+# Configure logging for PythonAnywhere
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler(f"maya_scraper_{datetime.now().strftime('%Y%m%d')}.log"),
+        logging.StreamHandler()
+    ]
+)
+
+def main():
+    try:
+        # Import and run the main scraper
+        from ground_news_scraper import main as scraper_main
+        
+        logging.info("Starting Maya News Scraper on PythonAnywhere")
+        scraper_main()
+        logging.info("Maya News Scraper completed successfully")
+        
+    except Exception as e:
+        logging.error(f"Error running Maya News Scraper: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -6,103 +6,119 @@ This script tests both keyword and prompt loading from Google Sheets.
 """
 
 import logging
-import sys
 import os
+import sys
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from sheets_client import CREDENTIALS_FILE
+
+logger = logging.getLogger(__name__)
+
+# Flattens line breaks and tabs so each prompt preview stays on one line
+_PREVIEW_WHITESPACE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+
+def _log_report(report):
+    """Log a test's buffered output lines as one record so tests don't interleave."""
+    logger.info("\n".join(report))
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
 
 def test_keywords_loading():
     """Test loading keywords from Google Sheets."""
-    print("\n=== Testing Keywords Loading ===")
+    report = ["\n=== Testing Keywords Loading ==="]
     
     try:
         # Import the function from ground_news_scraper
         from ground_news_scraper import load_keywords_from_sheet, get_fallback_categories
         
-        print("Loading keywords from Google Sheets...")
+        report.append("Loading keywords from Google Sheets...")
         categories = load_keywords_from_sheet()
         
         if categories:
-            print(f"✅ Successfully loaded {len(categories)} categories:")
+            report.append(f"✅ Successfully loaded {len(categories)} categories:")
             for category, keywords in categories.items():
-                print(f"  - {category}: {len(keywords)} keywords")
+                report.append(f"  - {category}: {len(keywords)} keywords")
                 # Show first few keywords as sample
-                sample_keywords = keywords[:3]
+                sample_keywords = list(islice(keywords, 3))
                 if len(keywords) > 3:
                     sample_keywords.append("...")
-                print(f"    Sample: {', '.join(sample_keywords)}")
+                report.append(f"    Sample: {', '.join(sample_keywords)}")
             return True
         else:
-            print("❌ Failed to load keywords from Google Sheets")
+            report.append("❌ Failed to load keywords from Google Sheets")
             return False
             
     except Exception as e:
-        print(f"❌ Error testing keywords loading: {e}")
+        report.append(f"❌ Error testing keywords loading: {e}")
         return False
+    finally:
+        _log_report(report)
 
 
 def test_prompts_loading():
     """Test loading prompts from Google Sheets."""
-    print("\n=== Testing Prompts Loading ===")
+    report = ["\n=== Testing Prompts Loading ==="]
     
     try:
         # Import the function from ground_news_scraper
         from ground_news_scraper import load_prompts_from_sheet, get_fallback_prompts
         
-        print("Loading prompts from Google Sheets...")
+        report.append("Loading prompts from Google Sheets...")
         prompts = load_prompts_from_sheet()
         
         if prompts:
-            print(f"✅ Successfully loaded {len(prompts)} prompts:")
+            report.append(f"✅ Successfully loaded {len(prompts)} prompts:")
             for prompt_name, prompt_text in prompts.items():
-                print(f"  - {prompt_name}: {len(prompt_text)} characters")
+                report.append(f"  - {prompt_name}: {len(prompt_text)} characters")
                 # Show first 100 characters as preview
-                preview = prompt_text[:100].replace('\n', ' ')
+                preview = prompt_text[:100].translate(_PREVIEW_WHITESPACE)
                 if len(prompt_text) > 100:
                     preview += "..."
-                print(f"    Preview: {preview}")
+                report.append(f"    Preview: {preview}")
             return True
         else:
-            print("❌ Failed to load prompts from Google Sheets")
+            report.append("❌ Failed to load prompts from Google Sheets")
             return False
             
     except Exception as e:
-        print(f"❌ Error testing prompts loading: {e}")
+        report.append(f"❌ Error testing prompts loading: {e}")
         return False
+    finally:
+        _log_report(report)
 
 
 def test_nick_keywords_loading():
     """Test loading keywords from nick.py."""
-    print("\n=== Testing Nick.py Keywords Loading ===")
+    report = ["\n=== Testing Nick.py Keywords Loading ==="]
     
     try:
         # Import the function from nick.py
-        from nick import load_keywords_from_sheet, get_fallback_keywords
+        from nick import init_gspread, load_keywords_from_sheet, get_fallback_keywords
         
-        print("Loading keywords from Google Sheets (nick.py)...")
-        categories = load_keywords_from_sheet()
+        report.append("Loading keywords from Google Sheets (nick.py)...")
+        categories = load_keywords_from_sheet(init_gspread())
         
         if categories:
-            print(f"✅ Successfully loaded {len(categories)} categories:")
+            report.append(f"✅ Successfully loaded {len(categories)} categories:")
             for category, keywords in categories.items():
-                print(f"  - {category}: {len(keywords)} keywords")
+                report.append(f"  - {category}: {len(keywords)} keywords")
             return True
         else:
-            print("❌ Failed to load keywords from Google Sheets (nick.py)")
+            report.append("❌ Failed to load keywords from Google Sheets (nick.py)")
             return False
             
     except Exception as e:
-        print(f"❌ Error testing nick.py keywords loading: {e}")
+        report.append(f"❌ Error testing nick.py keywords loading: {e}")
         return False
+    finally:
+        _log_report(report)
 
 
 def test_fallback_functionality():
     """Test that fallback functions work when Google Sheets is unavailable."""
-    print("\n=== Testing Fallback Functionality ===")
+    report = ["\n=== Testing Fallback Functionality ==="]
     
     try:
         from ground_news_scraper import get_fallback_categories, get_fallback_prompts
@@ -110,57 +126,85 @@ def test_fallback_functionality():
         
         # Test fallback categories
         fallback_categories = get_fallback_categories()
-        print(f"✅ Fallback categories available: {len(fallback_categories)} categories")
+        report.append(f"✅ Fallback categories available: {len(fallback_categories)} categories")
         
         # Test fallback prompts
         fallback_prompts = get_fallback_prompts()
-        print(f"✅ Fallback prompts available: {len(fallback_prompts)} prompts")
+        report.append(f"✅ Fallback prompts available: {len(fallback_prompts)} prompts")
         
         # Test nick fallback keywords
         nick_fallback = get_fallback_keywords()
-        print(f"✅ Nick fallback keywords available: {len(nick_fallback)} categories")
+        report.append(f"✅ Nick fallback keywords available: {len(nick_fallback)} categories")
         
         return True
         
     except Exception as e:
-        print(f"❌ Error testing fallback functionality: {e}")
+        report.append(f"❌ Error testing fallback functionality: {e}")
         return False
+    finally:
+        _log_report(report)
 
 
 def test_credentials_file():
-    """Test that credentials file exists."""
-    print("\n=== Testing Credentials File ===")
+    """Test that Google credentials are available (file or environment)."""
+    report = ["\n=== Testing Credentials File ==="]
     
-    if os.path.exists("credentials.json"):
-        print("✅ credentials.json file found")
-        return True
-    else:
-        print("❌ credentials.json file not found")
-        print("   Make sure you have the Google Sheets service account credentials file")
-        return False
+    try:
+        if Path(CREDENTIALS_FILE).is_file():
+            report.append("✅ credentials.json file found")
+            return True
+        elif os.getenv("GOOGLE_CREDENTIALS_JSON"):
+            # ground_news_scraper authenticates from this variable in CI
+            report.append("✅ GOOGLE_CREDENTIALS_JSON environment variable set")
+            return True
+        else:
+            report.append("❌ credentials.json file not found")
+            report.append("   Make sure you have the Google Sheets service account credentials file")
+            report.append("   or set the GOOGLE_CREDENTIALS_JSON environment variable")
+            return False
+    finally:
+        _log_report(report)
 
 
 def main():
     """Run all tests."""
-    print("🧪 Testing Google Sheets Configuration System")
-    print("=" * 50)
+    logger.info("🧪 Testing Google Sheets Configuration System")
+    logger.info("=" * 50)
+    
+    # The credentials check runs first: without them the Sheets tests can
+    # only time out on auth, so they are skipped
+    credentials_ok = test_credentials_file()
     
-    tests = [
-        ("Credentials File", test_credentials_file),
-        ("Keywords Loading", test_keywords_loading),
-        ("Prompts Loading", test_prompts_loading),
-        ("Nick Keywords Loading", test_nick_keywords_loading),
-        ("Fallback Functionality", test_fallback_functionality),
+    test_names = [
+        "Credentials File",
+        "Keywords Loading",
+        "Prompts Loading",
+        "Nick Keywords Loading",
+        "Fallback Functionality",
     ]
+    tests = [("Fallback Functionality", test_fallback_functionality)]
+    if credentials_ok:
+        tests += [
+            ("Keywords Loading", test_keywords_loading),
+            ("Prompts Loading", test_prompts_loading),
+            ("Nick Keywords Loading", test_nick_keywords_loading),
+        ]
+    else:
+        logger.info("\n⏭️  Skipping network tests (no Google credentials found)")
     
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
-            results.append((test_name, False))
+    # The tests are independent and network-bound, so run them concurrently
+    outcomes = {"Credentials File": credentials_ok}
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(test_func): test_name for test_name, test_func in tests}
+        for future in as_completed(futures):
+            test_name = futures[future]
+            try:
+                outcomes[test_name] = future.result()
+            except Exception as e:
+                _log_report([f"❌ {test_name} failed with exception: {e}"])
+                outcomes[test_name] = False
+    # Skipped tests are recorded as None
+    results = [(test_name, outcomes.get(test_name)) for test_name in test_names]
     
     # Summary
     print("\n" + "=" * 50)
@@ -168,7 +212,10 @@ def main():
     
     passed = 0
     for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
+        if result is None:
+            status = "⏭️  SKIP"
+        else:
+            status = "✅ PASS" if result else "❌ FAIL"
         print(f"  {status} - {test_name}")
         if result:
             passed += 1
@@ -184,4 +231,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     sys.exit(main())